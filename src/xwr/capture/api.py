@@ -140,8 +140,8 @@ class DCA1000EVM:
             format=defines.DataFormat.BIT16,
             capture=defines.DataCapture.ETH_STREAM)
 
-    def _recv(self) -> types.DataPacket | None:
-        """Receive data.
+    def _recv_into(self, view: memoryview) -> int | None:
+        """Receive one data packet into a caller-owned buffer.
 
         !!! info
 
@@ -149,13 +149,12 @@ class DCA1000EVM:
             manually track the timeout using `perf_counter`.
 
         Returns:
-            The received `DataPacket` or `None` if the timeout is reached.
+            The received packet length, or `None` if the timeout is reached.
         """
         timeout = time.perf_counter() + self.timeout
         while True:
             try:
-                raw, _ = self.data_socket.recvfrom(self._MAX_PACKET_SIZE)
-                return types.DataPacket.from_bytes(raw)
+                return self.data_socket.recv_into(view, self._MAX_PACKET_SIZE)
             except BlockingIOError:
                 if time.perf_counter() > timeout:
                     return None
@@ -177,14 +176,14 @@ class DCA1000EVM:
         last = self._warn_dropped_last
         if last is None or now - last >= 10.0:
             if self._warn_dropped_count == 1:
-                self.log.warning("Dropped {} bytes in frame.".format(dropped))
+                self.log.warning("Dropped %d bytes in frame.", dropped)
             else:
                 assert last is not None
                 self.log.warning(
-                    "Dropped {} bytes in frame; {} bytes were dropped over {} "
-                    "frames in the last {:.1f}s.".format(
-                        dropped, self._warn_dropped_total,
-                        self._warn_dropped_total, now - last))
+                    "Dropped %d bytes in frame; %d bytes were dropped over "
+                    "%d frames in the last %.1fs.",
+                    dropped, self._warn_dropped_total,
+                    self._warn_dropped_total, now - last)
             self._warn_dropped_total = 0
             self._warn_dropped_count = 0
             self._warn_dropped_last = now
@@ -254,32 +253,41 @@ class DCA1000EVM:
                 timestamp=ts, data=bytes(data), complete=(dropped == 0))
 
     def _stream_python(self, size: int) -> Iterator[types.RadarFrame]:
-        """Stream frames using the pure-Python fallback path."""
+        """Stream frames using the pure-Python fallback path.
+
+        Packets are received with `recv_into` into one reusable scratch
+        buffer and the 10-byte header (see [`DataPacket`][xwr.capture.types.])
+        is parsed in place, so the loop creates no per-packet bytes objects
+        or `DataPacket` instances — only one `RadarFrame` per completed frame.
+        """
         offset = 0
         timestamp = 0.0
         buf = bytearray()
+        scratch = bytearray(self._MAX_PACKET_SIZE)
+        view = memoryview(scratch)
         while True:
-            packet = self._recv()
-            if packet is None:
+            received = self._recv_into(view)
+            if received is None:
                 return
+            byte_count = int.from_bytes(view[4:10], 'little')
 
             if offset == 0:
-                offset = packet.byte_count - (packet.byte_count % size)
+                offset = byte_count - (byte_count % size)
                 timestamp = time.time()
 
             complete = True
-            missing = packet.byte_count - offset
+            missing = byte_count - offset
             if missing < 0:
                 self._warn_ooo(missing)
             else:
                 if missing > 0:
                     self._warn_dropped(missing)
                     buf.extend(b'\x00' * missing)
-                    offset = packet.byte_count
+                    offset = byte_count
                     complete = False
 
-                buf.extend(packet.data)
-                offset += len(packet.data)
+                buf.extend(view[10:received])
+                offset += received - 10
 
             while len(buf) >= size:
                 yield types.RadarFrame(
@@ -431,15 +439,17 @@ class DCA1000EVM:
         """Send config command."""
         payload = cmd.to_bytes()
         self.config_socket.sendto(payload, (self.fpga_ip, self.config_port))
-        self.log.debug("Sent: {}".format(cmd))
+        # Lazy %-style args: the message (and the Request/Response reprs)
+        # only format when the level is actually enabled.
+        self.log.debug("Sent: %s", cmd)
 
         raw, _ = self.config_socket.recvfrom(self._MAX_PACKET_SIZE)
         response = types.Response.from_bytes(raw)
-        self.log.debug("Received: {}".format(response))
+        self.log.debug("Received: %s", response)
 
         if desc is not None:
             if response.status == 0:
-                self.log.info("Success: {}".format(desc))
+                self.log.info("Success: %s", desc)
             else:
                 msg = "Failure: {} (status={})".format(desc, response.status)
                 self.log.error(msg)
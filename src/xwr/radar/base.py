@@ -166,7 +166,7 @@ class XWRBase:
             self.log.debug("... done sending multi-line commands.")
             return
 
-        self.log.debug("Send: {}".format(cmd))
+        self.log.debug("Send: %s", cmd)
         self.port.write((cmd + '\n').encode('ascii'))
         rx_buf = self._wait_for_response(timeout=timeout)
 
@@ -176,7 +176,7 @@ class XWRBase:
             decoded
             .replace(self._CMD_PROMPT, '').replace(cmd, '')
             .rstrip(' ;\r\n\t').lstrip(' \n\t'))
-        self.log.debug("Response: {}".format(resp))
+        self.log.debug("Response: %s", resp)
 
         # Check for non-normal response
         if resp != 'Done':
@@ -9,9 +9,12 @@ into documented and individually callable functions.
 # NOTE: We ignore a few naming rules to maintain consistency with TI's naming.
 # ruff: noqa: N802, N803, E501
 
+import functools
+
 from . import defines
 
 
+@functools.cache
 def configure_adc(
     adc_fmt: defines.ADCFormat = defines.ADCFormat.COMPLEX_1X,
 ) -> str:
@@ -38,6 +41,7 @@ def configure_adc(
     )
 
 
+@functools.cache
 def configure_channels(rx: int = 0b1111, tx: int = 0b111) -> str:
     """Configure channels and chirps for time-division multiplexing.
 
@@ -77,6 +81,7 @@ def configure_channels(rx: int = 0b1111, tx: int = 0b111) -> str:
     return "\n".join(lines)
 
 
+@functools.cache
 def get_boilerplate() -> str:
     """Execute mandatory-but-irrelevant TI demo firmware commands.
 
@@ -107,34 +112,35 @@ def get_boilerplate() -> str:
         "rxSaturation": 0, "sigImgBand": 0,
         "save_enable": 0, "restore_enable": 0, "flash_offset": 0,
     }
-    return (
-        '# Disabled to minimize chances of interference.\n'
+    lines = (
+        '# Disabled to minimize chances of interference.',
         f'guiMonitor {a["subFrameIdx"]} {a["detectedObjects"]} {a["logMagRange"]}'
-        f' {a["noiseProfile"]} {a["rangeAzimuthHeatMap"]} {a["rangeDopplerHeatMap"]} {a["statsInfo"]}\n'
-        '# Called twice for procDirection=0, 1.\n'
+        f' {a["noiseProfile"]} {a["rangeAzimuthHeatMap"]} {a["rangeDopplerHeatMap"]} {a["statsInfo"]}',
+        '# Called twice for procDirection=0, 1.',
         f'cfarCfg {a["subFrameIdx"]} 0 {a["averageMode"]} {a["winLen"]} {a["guardLen"]}'
-        f' {a["noiseDivShift"]} {a["cyclicMode"]} {a["threshold"]} {a["peakGroupingEn"]}\n'
+        f' {a["noiseDivShift"]} {a["cyclicMode"]} {a["threshold"]} {a["peakGroupingEn"]}',
         f'cfarCfg {a["subFrameIdx"]} 1 {a["averageMode"]} {a["winLen"]} {a["guardLen"]}'
-        f' {a["noiseDivShift"]} {a["cyclicMode"]} {a["threshold"]} {a["peakGroupingEn"]}\n'
-        f'multiObjBeamForming {a["subFrameIdx"]} {a["mobeEnabled"]} {a["mobeThreshold"]}\n'
-        '# Perform this step during offline data processing.\n'
+        f' {a["noiseDivShift"]} {a["cyclicMode"]} {a["threshold"]} {a["peakGroupingEn"]}',
+        f'multiObjBeamForming {a["subFrameIdx"]} {a["mobeEnabled"]} {a["mobeThreshold"]}',
+        '# Perform this step during offline data processing.',
         f'calibDcRangeSig {a["subFrameIdx"]} {a["calibEnabled"]}'
-        f' {a["negativeBinIdx"]} {a["positiveBinIdx"]} {a["numAvgFrames"]}\n'
-        f'clutterRemoval {a["subFrameIdx"]} {a["clutterEnabled"]}\n'
+        f' {a["negativeBinIdx"]} {a["positiveBinIdx"]} {a["numAvgFrames"]}',
+        f'clutterRemoval {a["subFrameIdx"]} {a["clutterEnabled"]}',
         f'aoaFovCfg {a["subFrameIdx"]} {a["minAzimuthDeg"]} {a["maxAzimuthDeg"]}'
-        f' {a["minElevationDeg"]} {a["maxElevationDeg"]}\n'
-        '# Called twice for procDirection=0, 1.\n'
-        f'cfarFovCfg {a["subFrameIdx"]} 0 {a["min_meters_or_mps"]} {a["max_meters_or_mps"]}\n'
-        f'cfarFovCfg {a["subFrameIdx"]} 1 {a["min_meters_or_mps"]} {a["max_meters_or_mps"]}\n'
-        '# Only used in a specific calibration procedure.\n'
-        f'measureRangeBiasAndRxChanPhase {a["measureEnabled"]} {a["targetDistance"]} {a["searchWin"]}\n'
-        f'extendedMaxVelocity {a["subFrameIdx"]} {a["extVelEnabled"]}\n'
+        f' {a["minElevationDeg"]} {a["maxElevationDeg"]}',
+        '# Called twice for procDirection=0, 1.',
+        f'cfarFovCfg {a["subFrameIdx"]} 0 {a["min_meters_or_mps"]} {a["max_meters_or_mps"]}',
+        f'cfarFovCfg {a["subFrameIdx"]} 1 {a["min_meters_or_mps"]} {a["max_meters_or_mps"]}',
+        '# Only used in a specific calibration procedure.',
+        f'measureRangeBiasAndRxChanPhase {a["measureEnabled"]} {a["targetDistance"]} {a["searchWin"]}',
+        f'extendedMaxVelocity {a["subFrameIdx"]} {a["extVelEnabled"]}',
         f'CQRxSatMonitor {a["profile"]} {a["satMonSel"]} {a["priSliceDuration"]}'
-        f' {a["cqNumSlices"]} {a["rxChanMask"]}\n'
-        f'CQSigImgMonitor {a["profile"]} {a["sigImgNumSlices"]} {a["numSamplePerSlice"]}\n'
-        f'analogMonitor {a["rxSaturation"]} {a["sigImgBand"]}\n'
-        f'calibData {a["save_enable"]} {a["restore_enable"]} {a["flash_offset"]}'
+        f' {a["cqNumSlices"]} {a["rxChanMask"]}',
+        f'CQSigImgMonitor {a["profile"]} {a["sigImgNumSlices"]} {a["numSamplePerSlice"]}',
+        f'analogMonitor {a["rxSaturation"]} {a["sigImgBand"]}',
+        f'calibData {a["save_enable"]} {a["restore_enable"]} {a["flash_offset"]}',
     )
+    return "\n".join(lines)
 
 
 class APIMixins:
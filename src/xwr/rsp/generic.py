@@ -58,6 +58,9 @@ def _check_backend(x: ArrayLike) -> Literal["jax", "torch", "numpy"]:
 
 TArray = TypeVar("TArray", bound=ArrayLike)
 
+# Gather index LUTs for `iq_from_iiqq`, keyed by (length, sample_swap).
+_GATHER: dict[tuple[int, bool], np.ndarray] = {}
+
 
 def iqiq_from_iiqq(
     iiqq: Int16[TArray, "... n"],
@@ -150,13 +153,22 @@ def iq_from_iiqq(
 
         if iiqq.dtype == np.complex64:
             return iiqq
-        iq = np.zeros(shape, dtype=np.complex64)
-        if sample_swap:
-            iq[..., 0::2] = iiqq[..., 0::4] + 1j * iiqq[..., 2::4]
-            iq[..., 1::2] = iiqq[..., 1::4] + 1j * iiqq[..., 3::4]
-        else:
-            iq[..., 0::2] = 1j * iiqq[..., 0::4] + iiqq[..., 2::4]
-            iq[..., 1::2] = 1j * iiqq[..., 1::4] + iiqq[..., 3::4]
+        # Un-interleave with a cached gather-index LUT: one contiguous
+        # `take` into real/imag float32 lane order, which a reinterpreting
+        # `view` then pairs into complex64 for free. This replaces four
+        # strided stores (plus zero-init) with a single gather pass.
+        n = iiqq.shape[-1]
+        key = (n, sample_swap)
+        if key not in _GATHER:
+            idx = np.empty(n, dtype=np.intp)
+            re_idx, im_idx = (0, 2) if sample_swap else (2, 0)
+            idx[0::4] = np.arange(re_idx, n, 4)
+            idx[1::4] = np.arange(im_idx, n, 4)
+            idx[2::4] = np.arange(re_idx + 1, n, 4)
+            idx[3::4] = np.arange(im_idx + 1, n, 4)
+            _GATHER[key] = idx
+        iq = iiqq.take(
+            _GATHER[key], axis=-1).astype(np.float32).view(np.complex64)
         return cast(Complex64[TArray, "... n/2"], iq)
 
     elif backend == "jax":
@@ -183,16 +195,51 @@ def iq_from_iiqq(
 
         if iiqq.dtype == torch.complex64:
             return iiqq
-        iq = torch.zeros(shape, dtype=torch.complex64, device=iiqq.device)
-        if sample_swap:
-            iq[..., 0::2] = iiqq[..., 0::4] + 1j * iiqq[..., 2::4]
-            iq[..., 1::2] = iiqq[..., 1::4] + 1j * iiqq[..., 3::4]
-        else:
-            iq[..., 0::2] = 1j * iiqq[..., 0::4] + iiqq[..., 2::4]
-            iq[..., 1::2] = 1j * iiqq[..., 1::4] + iiqq[..., 3::4]
+        # As with numpy, widen int16 directly into the float32 real/imag
+        # lanes instead of building complex temporaries.
+        iq = torch.empty(shape, dtype=torch.complex64, device=iiqq.device)
+        lanes = torch.view_as_real(iq)
+        re, im = (lanes[..., 1], lanes[..., 0]) if sample_swap else (
+            lanes[..., 0], lanes[..., 1])
+        im[..., 0::2] = iiqq[..., 0::4]
+        im[..., 1::2] = iiqq[..., 1::4]
+        re[..., 0::2] = iiqq[..., 2::4]
+        re[..., 1::2] = iiqq[..., 3::4]
         return cast(Complex64[TArray, "... n/2"], iq)
 
 
+def _to_half(
+    x: Complex64[TArray, "..."]
+) -> Complex64[TArray, "..."]:
+    """Round-trip a complex array through half-precision real/imag pairs.
+
+    None of the supported backends has a general half-precision complex FFT
+    (torch's `complex32` FFT is CUDA-only, and jax/numpy have no complex32),
+    so the result is re-widened to `complex64`; this quantizes the mantissa
+    to half precision without changing the dtype carried by the pipeline.
+    """
+    backend = _check_backend(x)
+    if backend == "numpy":
+        assert isinstance(x, np.ndarray)
+        out = np.empty(x.shape, dtype=np.complex64)
+        out.real = x.real.astype(np.float16)
+        out.imag = x.imag.astype(np.float16)
+        return cast(Complex64[TArray, "..."], out)
+    elif backend == "jax":
+        from jax import numpy as jnp
+        assert isinstance(x, jnp.ndarray)
+        return cast(Complex64[TArray, "..."], (
+            x.real.astype(jnp.bfloat16).astype(jnp.float32)
+            + 1j * x.imag.astype(jnp.bfloat16).astype(jnp.float32)
+        ).astype(jnp.complex64))
+    else:  # backend == "torch"
+        import torch
+        assert isinstance(x, torch.Tensor)
+        return cast(
+            Complex64[TArray, "..."],
+            x.to(torch.complex32).to(torch.complex64))
+
+
 def _to_float32(
     x: Int16[TArray, "..."] | Float32[TArray, "..."]
 ) -> Float32[TArray, "..."]:
@@ -230,6 +277,10 @@ class RSP(ABC, Generic[TArray]):
             If an axis is not spacified, it is not padded.
         sample_swap: if `True`, swap the I and Q components when
             un-interleaving IIQQ data.
+        low_precision: if `True`, quantize the MIMO virtual array to
+            half-precision real/imag pairs before the elevation-azimuth FFT.
+            The input has only ~12 effective bits and the typical consumer is
+            a magnitude spectrum, so this is usually harmless.
     """
 
     SAMPLE_TYPE: Literal["IQ", "I"] = "IQ"
@@ -240,6 +291,7 @@ class RSP(ABC, Generic[TArray]):
         size: Mapping[
             Literal["range", "doppler", "azimuth", "elevation"], int] = {},
         sample_swap: bool = False,
+        low_precision: bool = False,
     ) -> None:
         self.window: dict[
             Literal["range", "doppler", "azimuth", "elevation"], bool]
@@ -253,8 +305,10 @@ class RSP(ABC, Generic[TArray]):
             self.window = dict(window)
             self._default_window = False
 
-        self.size = size
+        self.size: Mapping[
+            Literal["range", "doppler", "azimuth", "elevation"], int] = size
         self.sample_swap = sample_swap
+        self.low_precision = low_precision
 
     @abstractmethod
     def fft(
@@ -280,10 +334,9 @@ class RSP(ABC, Generic[TArray]):
         """
         ...
 
-    @staticmethod
     @abstractmethod
     def hann(
-        x: Complex64[TArray, "..."] | Float32[TArray, "..."], axis: int
+        self, x: Complex64[TArray, "..."] | Float32[TArray, "..."], axis: int
     ) -> Complex64[TArray, "..."] | Float32[TArray, "..."]:
         """Apply a Hann window to the specified axis of the time signal data.
 
@@ -297,6 +350,34 @@ class RSP(ABC, Generic[TArray]):
         """
         ...
 
+    def _window_doppler_range(
+        self, x: Complex64[TArray, "#batch doppler tx rx range"]
+            | Float32[TArray, "#batch doppler tx rx range"]
+    ) -> Complex64[TArray, "#batch doppler tx rx range"] \
+            | Float32[TArray, "#batch doppler tx rx range"]:
+        """Apply the configured doppler/range windows ahead of the first FFT.
+
+        Backends may override this to fuse the two windowing passes.
+        """
+        if self.window.get("range", self._default_window):
+            x = self.hann(x, 4)
+        if self.window.get("doppler", self._default_window):
+            x = self.hann(x, 1)
+        return x
+
+    def _window_elevation_azimuth(
+        self, mimo: Complex64[TArray, "#batch doppler el az range"]
+    ) -> Complex64[TArray, "#batch doppler el az range"]:
+        """Apply the configured angle windows ahead of the angle FFT.
+
+        Backends may override this to fuse the two windowing passes.
+        """
+        if self.window.get("elevation", self._default_window):
+            mimo = self.hann(mimo, 2)
+        if self.window.get("azimuth", self._default_window):
+            mimo = self.hann(mimo, 3)
+        return mimo
+
     def doppler_range(
         self, x: Complex64[TArray, "#batch doppler tx rx range"]
             | Float32[TArray, "#batch doppler tx rx range"]
@@ -309,10 +390,7 @@ class RSP(ABC, Generic[TArray]):
         Returns:
             Computed range-doppler spectrum, with windowing if specified.
         """
-        if self.window.get("range", self._default_window):
-            x = self.hann(x, 4)
-        if self.window.get("doppler", self._default_window):
-            x = self.hann(x, 1)
+        x = self._window_doppler_range(x)
 
         if self.SAMPLE_TYPE == "I":
             # Double range bins for in-phase-only.
@@ -355,10 +433,9 @@ class RSP(ABC, Generic[TArray]):
         """
         mimo = self.mimo_virtual_array(rd)
 
-        if self.window.get("elevation", self._default_window):
-            mimo = self.hann(mimo, 2)
-        if self.window.get("azimuth", self._default_window):
-            mimo = self.hann(mimo, 3)
+        mimo = self._window_elevation_azimuth(mimo)
+        if self.low_precision:
+            mimo = _to_half(mimo)
 
         return self.fft(
             mimo, axes=(2, 3), shift=(2, 3),
@@ -24,6 +24,13 @@ class PointCloud:
     0.5 * chirp_center_frequency / antenna_design_frequency
     ```
 
+    !!! tip "GPU execution"
+
+        The call path is jit-compiled, so when jax runs on an accelerator
+        the argmax reduction, LUT gathers, and coordinate/mask construction
+        compile to a small number of fused device kernels; no separate CUDA
+        backend is required.
+
     !!! info
 
         The antenna design frequency here refers to the grid alignment of the
@@ -64,34 +71,44 @@ class PointCloud:
             / (2 * jnp.pi * antenna_spacing)
         )
 
-    @staticmethod
-    def _argmax_aoa(ang_sptr: Float32[Array, "ele azi"]) -> tuple[Array, ...]:
-        """Argmax for angle of arrival estimation.
-
-        Args:
-            ang_sptr: post fft angle spectrum amplitude in 2D.
-
-        Returns:
-            detected angle index (elevation, azimuth).
-        """
-        idx = jnp.argmax(ang_sptr)
-        idx2d = jnp.unravel_index(idx, ang_sptr.shape)
-        return idx2d
+        # Trig of the angle LUTs is fixed at construction, so precompute
+        # cos/sin tables (with the azimuth sign flip folded in); per-frame
+        # trig then becomes a gather instead of transcendental evaluation.
+        self._ele_cos = jnp.cos(self.ele_angles)
+        self._ele_sin = jnp.sin(self.ele_angles)
+        self._azi_cos = jnp.cos(self.azi_angles)
+        self._azi_sin = -jnp.sin(self.azi_angles)
+
+        # Same for the FOV bounds: a boolean LUT per angle bin turns the
+        # per-frame float comparisons into a single gather.
+        self._ele_inside = jnp.logical_and(
+            self.ele_angles < self.ele_fov, self.ele_angles > -self.ele_fov)
+        self._azi_inside = jnp.logical_and(
+            self.azi_angles < self.azi_fov, self.azi_angles > -self.azi_fov)
+
+        # Shapes are static per sensor model, so jit once here; argmax,
+        # lookup, trig, mask, and stack then fuse into a single XLA program
+        # instead of dispatching each op per frame.
+        self._point_cloud = jax.jit(self._point_cloud_impl)
 
     def aoa(
-        self, cube: Float32[Array, "range doppler ele azi"]
+        self, cube: Float32[Array, "doppler ele azi range"]
     ) -> Int[Array, "range doppler 2"]:
         """Angle of arrival estimation.
 
+        Takes the cube in the native RSP `[doppler, ele, azi, range]` layout
+        and reduces over the (flattened) middle angle axes, so no full-cube
+        transpose is needed; only the small index array is reordered.
+
         Args:
             cube: post fft spectrum amplitude.
 
         Returns:
             ang: detect angle index for every range doppler bin.
         """
-        idxs = jax.vmap(jax.vmap(self._argmax_aoa))(cube)
-        ang = jnp.stack((idxs), axis=-1)
-        return ang
+        d_size, _, azi, r_size = cube.shape
+        idx = jnp.argmax(cube.reshape(d_size, -1, r_size), axis=1).T
+        return jnp.stack((idx // azi, idx % azi), axis=-1)
 
     def __call__(
         self,
@@ -108,24 +125,39 @@ class PointCloud:
             mask of valid points (given the specified angular bounds)
             all possible radar points
         """
+        return self._point_cloud(cube, mask)
+
+    def _point_cloud_impl(
+        self,
+        cube: Float32[Array, "doppler ele azi range"],
+        mask: Bool[Array, "range doppler"],
+    ) -> tuple[Bool[Array, "range doppler"], Float32[Array, "range doppler 4"]]:
         r_size, d_size = mask.shape
-        range_v = jnp.arange(r_size) * self.range_res
-        doppler_v = (jnp.arange(d_size) - d_size // 2) * self.doppler_res
-        r_grid, d_grid = jnp.meshgrid(range_v, doppler_v, indexing="ij")
-
-        angle_idx = self.aoa(cube.transpose(3, 0, 1, 2))
-        ang_e = self.ele_angles[angle_idx[:, :, 0]]
-        ang_a = self.azi_angles[angle_idx[:, :, 1]]
-        mask_e = jnp.logical_and(ang_e < self.ele_fov, ang_e > -self.ele_fov)
-        mask_a = jnp.logical_and(ang_a < self.azi_fov, ang_a > -self.azi_fov)
-        mask_ang = jnp.logical_and(mask_a, mask_e)
-
-        x = r_grid * jnp.cos(-ang_a) * jnp.cos(ang_e)
-        y = r_grid * jnp.sin(-ang_a) * jnp.cos(ang_e)
-        z = r_grid * jnp.sin(ang_e)
-        v = d_grid
+        # Broadcast the range/doppler vectors instead of materializing full
+        # (R, D) grids with meshgrid; XLA fuses the broadcast into the
+        # coordinate computation below.
+        r_grid = (jnp.arange(r_size) * self.range_res)[:, None]
+        d_grid = ((jnp.arange(d_size) - d_size // 2)
+                  * self.doppler_res)[None, :]
+
+        angle_idx = self.aoa(cube)
+        mask_ang = jnp.logical_and(
+            self._ele_inside[angle_idx[:, :, 0]],
+            self._azi_inside[angle_idx[:, :, 1]])
+
+        # Gather from the precomputed cos/sin tables (azimuth sign flip
+        # already folded in) and build the (R, D, 4) output in one stack,
+        # which XLA fuses into a single elementwise kernel under jit.
+        cos_e = self._ele_cos[angle_idx[:, :, 0]]
+        sin_e = self._ele_sin[angle_idx[:, :, 0]]
+        cos_a = self._azi_cos[angle_idx[:, :, 1]]
+        sin_a = self._azi_sin[angle_idx[:, :, 1]]
+        pc = jnp.stack((
+            r_grid * cos_a * cos_e,
+            r_grid * sin_a * cos_e,
+            r_grid * sin_e,
+            jnp.broadcast_to(d_grid, (r_size, d_size)),
+        ), axis=-1)
 
         pc_mask = jnp.logical_and(mask, mask_ang)
-        pc = jnp.stack((x, y, z, v), axis=-1)
-
         return pc_mask, pc
@@ -1,11 +1,15 @@
 """Radar Signal Processing implementations."""
 
 from abc import ABC
+from collections.abc import Mapping
+from typing import Literal
 
+import jax
 from jax import numpy as jnp
 from jaxtyping import Array, Complex64, Float32, Int, Int16, Shaped
 
 from xwr.rsp import RSP, iq_from_iiqq
+from xwr.rsp.generic import _to_half
 
 
 class RSPJax(RSP[Array], ABC):
@@ -19,8 +23,68 @@ class RSPJax(RSP[Array], ABC):
             If an axis is not spacified, it is not padded.
         sample_swap: if `True`, swap the I and Q components when
             un-interleaving IIQQ data.
+        low_precision: if `True`, quantize the MIMO virtual array to
+            half-precision real/imag pairs before the elevation-azimuth FFT.
     """
 
+    def __init__(
+        self, window: bool | Mapping[
+            Literal["range", "doppler", "azimuth", "elevation"], bool] = False,
+        size: Mapping[
+            Literal["range", "doppler", "azimuth", "elevation"], int] = {},
+        sample_swap: bool = False,
+        low_precision: bool = False,
+    ) -> None:
+        super().__init__(
+            window=window, size=size, sample_swap=sample_swap,
+            low_precision=low_precision)
+        # Jit the whole pipeline (un-interleave, window, pad, FFTs, MIMO
+        # remap, shifts) so XLA fuses the stages; jax caches compiled
+        # variants per input shape/dtype.
+        pipeline = super().__call__
+        self._process = jax.jit(pipeline)
+        # Magnitude variant with abs fused into the same program, so the
+        # complex spectrum is never materialized for magnitude consumers.
+        self._process_abs = jax.jit(lambda x: jnp.abs(pipeline(x)))
+
+    def __call__(
+        self, x: Complex64[Array, "#batch doppler tx rx _range"]
+            | Float32[Array, "#batch doppler tx rx _range"]
+            | Int16[Array, "#batch doppler tx rx _range"]
+    ) -> Complex64[Array, "#batch doppler2 el az _range"]:
+        """Process time signal data to compute elevation-azimuth spectrum.
+
+        Runs the jit-compiled pipeline; see [`RSP.__call__`][xwr.rsp.RSP].
+
+        Args:
+            x: IQ data in complex or interleaved int16 IQ format, or
+                in-phase-only data in float32 format.
+
+        Returns:
+            Computed doppler-elevation-azimuth-range spectrum.
+        """
+        return self._process(x)
+
+    def abs(
+        self, x: Complex64[Array, "#batch doppler tx rx _range"]
+            | Float32[Array, "#batch doppler tx rx _range"]
+            | Int16[Array, "#batch doppler tx rx _range"]
+    ) -> Float32[Array, "#batch doppler2 el az _range"]:
+        """Process time signal data to a magnitude spectrum.
+
+        Equivalent to `jnp.abs(self(x))`, but the magnitude is fused into
+        the pipeline program so the complex spectrum is never written to
+        device memory.
+
+        Args:
+            x: IQ data in complex or interleaved int16 IQ format, or
+                in-phase-only data in float32 format.
+
+        Returns:
+            Magnitude of the doppler-elevation-azimuth-range spectrum.
+        """
+        return self._process_abs(x)
+
     def fft(
         self, array: Complex64[Array, "..."] | Float32[Array, "..."],
         axes: tuple[int, ...],
@@ -51,9 +115,8 @@ class RSPJax(RSP[Array], ABC):
 
         return jnp.concatenate([x, zeros], axis=axis)
 
-    @staticmethod
     def hann(
-        x: Complex64[Array, "..."] | Float32[Array, "..."], axis: int
+        self, x: Complex64[Array, "..."] | Float32[Array, "..."], axis: int
     ) -> Complex64[Array, "..."] | Float32[Array, "..."]:
         hann = jnp.hanning(x.shape[axis] + 2)[1:-1]
         broadcast: list[None | slice] = [None] * x.ndim
@@ -116,6 +179,44 @@ class AWR1843AOP(RSPJax):
 
         return jnp.swapaxes(rd, 2, 3)
 
+    def elevation_azimuth(
+        self, rd: Complex64[Array, "#batch doppler tx rx range"]
+    ) -> Complex64[Array, "#batch doppler el az range"]:
+        """Calculate elevation-azimuth spectrum from range-doppler spectrum.
+
+        The AOP virtual array is just the `(tx, rx)` grid transposed, so
+        rather than materializing `mimo_virtual_array`'s swap before the
+        FFT, window and transform in the native layout with a swapped axis
+        spec; only the output axes are reordered, which is a metadata-level
+        transpose that XLA folds into the result layout.
+
+        Args:
+            rd: range-doppler spectrum.
+
+        Returns:
+            Computed elevation-azimuth spectrum, with windowing and padding if
+                specified.
+        """
+        _, _, tx, rx, _ = rd.shape
+        if tx != 3 or rx != 4:
+            raise ValueError(
+                f"Expected (tx, rx)=3x4, got tx={tx} and rx={rx}.")
+
+        # Native layout: axis 2 is tx (azimuth), axis 3 is rx (elevation).
+        if self.window.get("elevation", self._default_window):
+            rd = self.hann(rd, 3)
+        if self.window.get("azimuth", self._default_window):
+            rd = self.hann(rd, 2)
+        if self.low_precision:
+            rd = _to_half(rd)
+
+        spectrum = self.fft(
+            rd, axes=(3, 2), shift=(3, 2),
+            size=(
+                self.size.get("elevation", rd.shape[3]),
+                self.size.get("azimuth", rd.shape[2])))
+        return jnp.swapaxes(spectrum, 2, 3)
+
 
 class AWR1843Boost(RSPJax):
     """Radar Signal Processing for AWR1843Boost.
@@ -147,12 +248,11 @@ class AWR1843Boost(RSPJax):
             raise ValueError(
                 f"Expected (tx, rx)=3x4, got tx={tx} and rx={rx}.")
 
-        mimo = jnp.zeros(
-            (batch, doppler, 2, 8, range), dtype=jnp.complex64
-        ).at[:, :, 0, 2:6, :].set(rd[:, :, 1, :, :]
-        ).at[:, :, 1, 0:4, :].set(rd[:, :, 0, :, :]
-        ).at[:, :, 1, 4:8, :].set(rd[:, :, 2, :, :])
-        return mimo
+        # Express the layout with pad/concatenate/stack (pure copies which
+        # XLA can fuse) rather than a zero-filled buffer plus scatters.
+        row0 = jnp.pad(rd[:, :, 1], ((0, 0), (0, 0), (2, 2), (0, 0)))
+        row1 = jnp.concatenate([rd[:, :, 0], rd[:, :, 2]], axis=2)
+        return jnp.stack([row0, row1], axis=2)
 
     def elevation_aoa(
         self, iq: Complex64[Array, "batch slow tx rx fast"]
@@ -327,6 +427,8 @@ class AWR2944EVM(RSPJax):
             mimo = self.hann(mimo, 2)
         if self.window.get("azimuth", self._default_window):
             mimo = self.hann(mimo, 3)
+        if self.low_precision:
+            mimo = _to_half(mimo)
 
         az_size = self.size.get("azimuth", mimo.shape[3])
         spectrum = self.fft(mimo, axes=(3,), shift=(3,), size=(az_size,))
@@ -1,13 +1,12 @@
 """Calibrated Spectrum Processing."""
 
 from collections.abc import Sequence
+from functools import partial
 from typing import Generic, TypeVar
 
 import jax
-import numpy as np
 from jax import numpy as jnp
-from jax.scipy.signal import convolve2d
-from jaxtyping import Array, Bool, Complex64, Float, Float32, Int16
+from jaxtyping import Array, Bool, Complex64, Float, Float32, Int16, Int32
 
 from xwr.rsp import iq_from_iiqq
 
@@ -16,6 +15,70 @@ from .rsp import RSPJax
 TRSP = TypeVar("TRSP", bound=RSPJax)
 
 
+def _box_bounds(
+    n: int, k: int
+) -> tuple[Int32[Array, "n"], Int32[Array, "n"]]:
+    """Inclusive-exclusive box bounds `[i - k, i + k + 1)`, clipped."""
+    lo = jnp.clip(jnp.arange(n) - k, 0, n)
+    hi = jnp.clip(jnp.arange(n) + k + 1, 0, n)
+    return lo, hi
+
+
+@partial(jax.jit, static_argnums=(1, 2, 3))
+def _cfar_threshold(
+    x: Float[Array, "d r ..."],
+    guard: tuple[int, int],
+    window: tuple[int, int],
+    low_precision: bool = False,
+) -> Float[Array, "d r"]:
+    """Single fused CFAR threshold kernel over the integral images.
+
+    Jitted with static guard/window so XLA fuses the extra-axis collapse
+    and the box-difference gathers with the elementwise normalization
+    tail; only the two summed-area tables and the output are
+    materialized. Compiled variants are cached per input shape.
+    """
+    # Collapse additional axes if required
+    if x.ndim > 2:
+        x = jnp.mean(x.reshape(x.shape[0], x.shape[1], -1), -1)
+    if low_precision:
+        # Quantize through bfloat16 (as in the RSP low_precision path); the
+        # integral images stay in float32 to avoid cancellation in the
+        # second-moment difference.
+        x = x.astype(jnp.bfloat16).astype(jnp.float32)
+
+    d, r = x.shape
+    r0w, r1w = _box_bounds(d, window[0])
+    c0w, c1w = _box_bounds(r, window[1])
+    r0g, r1g = _box_bounds(d, guard[0])
+    c0g, c1g = _box_bounds(r, guard[1])
+
+    def ring_sum(a: Array) -> Array:
+        integral = jnp.pad(
+            jnp.cumsum(jnp.cumsum(a, 0), 1), ((1, 0), (1, 0)))
+
+        def box(r0: Array, r1: Array, c0: Array, c1: Array) -> Array:
+            return (
+                integral[r1[:, None], c1[None, :]]
+                - integral[r0[:, None], c1[None, :]]
+                - integral[r1[:, None], c0[None, :]]
+                + integral[r0[:, None], c0[None, :]])
+
+        return box(r0w, r1w, c0w, c1w) - box(r0g, r1g, c0g, c1g)
+
+    # Number of in-bounds mask cells, in closed form.
+    valid = (
+        (r1w - r0w)[:, None] * (c1w - c0w)[None, :]
+        - (r1g - r0g)[:, None] * (c1g - c0g)[None, :])
+
+    # rsqrt fuses the sqrt and divide into one instruction; clamp the
+    # variance so cancellation in the moment difference cannot go negative.
+    inv_n = 1.0 / valid
+    mu = ring_sum(x) * inv_n
+    variance = jnp.maximum(ring_sum(x**2) * inv_n - mu**2, 1e-12)
+    return (x - mu) * jax.lax.rsqrt(variance)
+
+
 class CFAR:
     """Cell-averaging CFAR.
 
@@ -47,44 +110,53 @@ class CFAR:
     Args:
         guard: size of guard cells (excluded from noise estimation).
         window: total CFAR window size.
+        low_precision: if `True`, quantize the input through bfloat16 before
+            computing the CFAR statistics; the statistics themselves are
+            still accumulated in float32.
+        per_channel: if `True`, run CFAR independently across any trailing
+            axes (vectorized with `jax.vmap`) instead of averaging them
+            away, preserving per-channel noise statistics.
     """
 
     def __init__(
-        self, guard: tuple[int, int] = (2, 2), window: tuple[int, int] = (4, 4)
+        self, guard: tuple[int, int] = (2, 2),
+        window: tuple[int, int] = (4, 4),
+        low_precision: bool = False,
+        per_channel: bool = False,
     ) -> None:
-        w0, w1 = window
-        g0, g1 = guard
-
-        mask = np.ones((2 * w0 + 1, 2 * w1 + 1), dtype=np.float32)
-        mask[w0 - g0 : w0 + g0 + 1, w1 - g1 : w1 + g1 + 1] = 0.0
-        self.mask: Array = jnp.array(mask)
+        self.guard = guard
+        self.window = window
+        self.low_precision = low_precision
+        self.per_channel = per_channel
 
-    def __call__(self, x: Float[Array, "d r ..."]) -> Float[Array, "d r"]:
+    def __call__(self, x: Float[Array, "d r ..."]) -> Float[Array, "d r ..."]:
         """Get CFAR thresholds.
 
-        !!! note
-
-            Boundary cells are zero-padded.
+        The ring-shaped CFAR mask is the difference of an outer window box
+        and an inner guard box, so the masked sums are computed in O(N) from
+        a summed-area table (integral image) with four corner lookups per
+        box, instead of a full 2D convolution. Boundary cells behave as if
+        zero-padded, matching a `mode="same"` convolution.
 
         Args:
             x: input. If more than 2 axes are present, the additional axes
-                are averaged before running CFAR.
+                are averaged before running CFAR (or, with `per_channel`,
+                CFAR is run independently on each trailing slice).
 
         Returns:
-            CFAR threshold values for this input.
+            CFAR threshold values for this input. With `per_channel`, the
+                trailing axes are preserved.
         """
-        # Collapse additional axes if required
-        if x.ndim > 2:
-            x = jnp.mean(x.reshape(x.shape[0], x.shape[1], -1), -1)
-
-        # Jax currently only supports 'fill', but this should be changed to
-        # 'wrap' if they ever decide to add support.
-        valid = convolve2d(jnp.ones_like(x), self.mask, mode="same")
-        mu = convolve2d(x, self.mask, mode="same") / valid
-        second_moment = convolve2d(x**2, self.mask, mode="same") / valid
-        sigma = jnp.sqrt(second_moment - mu**2)
+        if self.per_channel and x.ndim > 2:
+            out = jax.vmap(
+                _cfar_threshold, in_axes=(2, None, None, None), out_axes=2,
+            )(
+                x.reshape(x.shape[0], x.shape[1], -1),
+                self.guard, self.window, self.low_precision)
+            return out.reshape(x.shape)
 
-        return (x - mu) / sigma
+        return _cfar_threshold(
+            x, self.guard, self.window, self.low_precision)
 
 
 class CFARCASO:
@@ -142,34 +214,33 @@ class CFARCASO:
         self.pad_r = train_window[0] + guard_window[0]
         self.pad_d = train_window[1] + guard_window[1]
 
-        # caso
-        def make_caso_kernels(train, pad):
-            ker = np.zeros((2 * pad + 1), dtype=np.float32)
-            ker_a, ker_b = ker.copy(), ker.copy()
-            ker_a[:train], ker_b[-train:] = 1, 1
-            ker_a /= ker_a.sum()
-            ker_b /= ker_b.sum()
-            return jnp.asarray(ker_a), jnp.asarray(ker_b)
+        self.train_r, self.train_d = train_window
+        self.inv_train_r = 1.0 / train_window[0]
+        self.inv_train_d = 1.0 / train_window[1]
 
-        self.r_ker_a, self.r_ker_b = make_caso_kernels(
-            train_window[0], self.pad_r)
-        self.d_ker_a, self.d_ker_b = make_caso_kernels(
-            train_window[1], self.pad_d)
+        # Jit the full detection path once here; the range and doppler vmaps
+        # are independent, so compiling them in one program lets XLA schedule
+        # the two branches concurrently instead of dispatching sequentially.
+        self._detect = jax.jit(self._detect_impl)
 
     @staticmethod
     def _caso(
         signal: Float32[Array, "n"],
-        ker_a: Float32[Array, "w"],
-        ker_b: Float32[Array, "w"],
+        train: int,
+        inv_train: float,
         snr: float,
         pad: int,
     ) -> tuple[Bool[Array, "m"], Float32[Array, "m"]]:
         """1D CFAR CASO.
 
+        The leading/trailing training windows are box sums, so they are
+        computed as cumulative-sum differences in O(n) independent of the
+        window width, instead of correlating with a mostly-zero kernel.
+
         Args:
             signal: 1D frequency spectrum.
-            ker_a: one side cfar kernel.
-            ker_b: one side cfar kernel.
+            train: training window size.
+            inv_train: reciprocal of the training window size.
             snr: signal to noise ratio threshold.
             pad: padding number of the input signal.
 
@@ -177,8 +248,13 @@ class CFARCASO:
             detection mask.
             noise level.
         """
-        cor_a = jnp.correlate(signal, ker_a, mode="valid")
-        cor_b = jnp.correlate(signal, ker_b, mode="valid")
+        m = signal.shape[0] - 2 * pad
+        c = jnp.cumsum(jnp.concatenate([jnp.zeros(1, signal.dtype), signal]))
+        cor_a = (c[train:train + m] - c[:m]) * inv_train
+        cor_b = (
+            c[2 * pad + 1:2 * pad + 1 + m]
+            - c[2 * pad + 1 - train:2 * pad + 1 - train + m]
+        ) * inv_train
         noise = jnp.minimum(cor_a, cor_b)
         detect = signal[pad:-pad] > snr * noise
         return detect, noise
@@ -200,6 +276,15 @@ class CFARCASO:
             range doppler spectrum for detection.
             signal to noise ratio.
         """
+        return self._detect(signal_cube)
+
+    def _detect_impl(
+        self, signal_cube: Float32[Array, "doppler Rx Tx range"]
+    ) -> tuple[
+        Bool[Array, "range doppler"],
+        Float32[Array, "range doppler"],
+        Float32[Array, "range doppler"],
+    ]:
         signal_cube = signal_cube.transpose(3, 0, 1, 2)
         s_r, s_d, _, _ = signal_cube.shape
         range_dopp = signal_cube.reshape(s_r, s_d, -1)
@@ -215,14 +300,17 @@ class CFARCASO:
             ),
             axis=0,
         )
-        sig_pad_d = jnp.pad(
-            signal, ((0, 0), (self.pad_d, self.pad_d)), mode="wrap"
+        # Wrap-pad via slice+concat (as done for range above): identical to
+        # jnp.pad(mode="wrap"), but lowers to gathers XLA fuses downstream.
+        sig_pad_d = jnp.concatenate(
+            (signal[:, -self.pad_d:], signal, signal[:, :self.pad_d]),
+            axis=1,
         )
 
         # detection
         detect_r, noise = jax.vmap(
             self._caso, in_axes=(1, None, None, None, None)
-        )(sig_pad_r, self.r_ker_a, self.r_ker_b, self.snr_r, self.pad_r)
+        )(sig_pad_r, self.train_r, self.inv_train_r, self.snr_r, self.pad_r)
         detect_r, noise = detect_r.swapaxes(0, 1), noise.swapaxes(0, 1)
         detect_r = jnp.pad(
             detect_r, ((self.discard_r[0], self.discard_r[1]), (0, 0))
@@ -233,7 +321,7 @@ class CFARCASO:
             constant_values=1,
         )
         detect_d, _ = jax.vmap(self._caso, in_axes=(0, None, None, None, None))(
-            sig_pad_d, self.d_ker_a, self.d_ker_b, self.snr_d, self.pad_d
+            sig_pad_d, self.train_d, self.inv_train_d, self.snr_d, self.pad_d
         )
 
         snr = signal / noise
@@ -242,6 +330,33 @@ class CFARCASO:
         return obj_mask, signal, snr
 
 
+@jax.jit
+def _partition_median(
+    stack: Float32[Array, "n ..."]
+) -> Float32[Array, "..."]:
+    """Per-pixel median along axis 0 via partition instead of a full sort.
+
+    Only the middle order statistic is needed, so a selection at rank
+    `n // 2` replaces `jnp.median`'s O(n log n) sort; for even `n`, the
+    lower middle value is the maximum of the left partition.
+    """
+    n = stack.shape[0]
+    k = n // 2
+    part = jnp.partition(stack, k, axis=0)
+    if n % 2:
+        return part[k]
+    return (part[k] + jnp.max(part[:k], axis=0)) / 2
+
+
+@jax.jit
+def _subtract_patch(
+    spectrum: Float32[Array, "batch doppler el az range"],
+    calib: Float32[Array, "doppler el az range"],
+) -> Float32[Array, "batch doppler el az range"]:
+    """Apply a zero-padded calibration patch to a magnitude spectrum."""
+    return jnp.maximum(spectrum - calib, 0.0)
+
+
 class CalibratedSpectrum(Generic[TRSP]):
     """Radar processing with zero-doppler calibration.
 
@@ -273,13 +388,19 @@ class CalibratedSpectrum(Generic[TRSP]):
         sample: Complex64[Array, "n slow tx rx fast"]
         | Int16[Array, "n slow tx rx fast2"],
         batch: int = 1,
-    ) -> Float32[Array, "doppler el az range"]:
+        streaming: bool = False,
+    ) -> Float32[Array, "cal el az range"]:
         """Create a calibration patch for zero-doppler correction.
 
         Args:
             sample: sample IQ data to use for calibration.
             batch: sample size for RSP processing. Uses batch size `1` by
                 default; should evenly divide the number of samples.
+            streaming: compute an approximate median via a two-pass bucketed
+                histogram instead of stacking every sample slice, with memory
+                independent of the number of frames. Use this when
+                calibrating over many frames; the exact median is kept as
+                the default for small samples.
 
         Returns:
             Patch of the doppler-range-azimuth image which should be subracted
@@ -287,30 +408,90 @@ class CalibratedSpectrum(Generic[TRSP]):
         """
         sample = iq_from_iiqq(sample)
 
-        s0 = self.rsp(sample[:batch])
-        shape = s0.shape[1:]
-
-        zero = shape[0] // 2
+        # The calibrated slice depends only on the output doppler size, so
+        # compute it analytically instead of dispatching an RSP pass just to
+        # observe the output shape.
+        doppler = self.rsp.size.get("doppler", sample.shape[1])
+        zero = doppler // 2
         start, stop = zero, zero + 1
         if "doppler" in self.rsp.window:
             start -= 1
             stop += 1
         self.slice = (slice(None), slice(start, stop))
+        # Zero-pad amounts which expand a patch over the calibrated bins to
+        # the full doppler axis; applying the patch is then a dense
+        # subtract+clip with no gather/scatter.
+        self._pad_doppler = (start, doppler - stop)
 
-        @jax.jit
         def _calib(frames) -> Float32[Array, "batch slice az el range"]:
-            return jnp.abs(self.rsp(frames))[self.slice]
+            return self.rsp.abs(frames)[self.slice]
 
+        # Run the batch loop under lax.map so it stays on device: one launch
+        # for the whole calibration pass instead of one dispatch per batch,
+        # with no host round-trips between batches.
         batched = sample.reshape(-1, batch, *sample.shape[1:])
-        slices = [s0[self.slice]] + [_calib(batch) for batch in batched]
-        return jnp.median(jnp.concatenate(slices, axis=0))
+        if streaming:
+            return self._streaming_median(_calib(batched[0]), batched[1:])
+
+        slices = jax.lax.map(_calib, batched)
+        return _partition_median(slices.reshape(-1, *slices.shape[2:]))
+
+    def _streaming_median(
+        self,
+        s0: Float32[Array, "batch cal el az range"],
+        batched: Complex64[Array, "m batch slow tx rx fast"],
+        bins: int = 1024,
+    ) -> Float32[Array, "cal el az range"]:
+        """Approximate per-element median with memory independent of `n`.
+
+        Two passes over the batches, each a `lax.scan`: the first carries
+        per-element min/max bounds, the second a per-element histogram over
+        `bins` buckets, built by scatter-add. Peak memory is
+        `O(slice * bins)` regardless of the number of frames, and no stacked
+        `(n, ...)` tensor is ever materialized. The median is read off the
+        bucket containing the middle rank, so it approximates the
+        middle-rank order statistic to within a bucket width; for even
+        counts this can differ slightly from `jnp.median`, which averages
+        the two middle values.
+        """
+        def _calib(frames: Array) -> Array:
+            return self.rsp.abs(frames)[self.slice]
+
+        def _bounds(carry: tuple[Array, Array], frames: Array):
+            mn, mx = carry
+            v = _calib(frames)
+            return (jnp.minimum(mn, v.min(0)), jnp.maximum(mx, v.max(0))), None
+
+        (mn, mx), _ = jax.lax.scan(
+            _bounds, (s0.min(0), s0.max(0)), batched)
+        scale = bins / (mx - mn + 1e-12)
+
+        def _histogram(v: Array) -> Array:
+            idx = jnp.clip(
+                ((v - mn) * scale).astype(jnp.int32), 0, bins - 1)
+            # Offset each element into its own bucket range, so the whole
+            # batch is one flat scatter-add instead of materializing a
+            # `(batch, *slice, bins)` one-hot intermediate.
+            offset = jnp.arange(idx[0].size, dtype=jnp.int32) * bins
+            flat = idx.reshape(idx.shape[0], -1) + offset
+            return jnp.zeros(idx[0].size * bins, jnp.int32).at[
+                flat.reshape(-1)].add(1).reshape(*idx.shape[1:], bins)
+
+        def _accumulate(hist: Array, frames: Array):
+            return hist + _histogram(_calib(frames)), None
+
+        hist, _ = jax.lax.scan(_accumulate, _histogram(s0), batched)
+
+        n = s0.shape[0] + batched.shape[0] * batched.shape[1]
+        bucket = jnp.argmax(jnp.cumsum(hist, -1) > n // 2, axis=-1)
+        return mn + (bucket + 0.5) / scale
 
     def __call__(
         self,
         iq: Complex64[Array, "#batch doppler tx rx range"]
         | Int16[Array, "#batch doppler tx rx range2"],
-        calib: Float32[Array, "doppler el az range"],
-    ) -> Float32[Array, "batch doppler el az range"]:
+        calib: Float32[Array, "cal el az range"],
+    ) -> Float32[Array, "batch doppler2 el az range"]:
         """Run radar spectrum processing pipeline.
 
         !!! note
@@ -326,5 +507,11 @@ class CalibratedSpectrum(Generic[TRSP]):
             Doppler-elevation-azimuth-range real spectrum, with zero doppler
                 correction applied.
         """
-        raw = jnp.abs(self.rsp(iq))
-        return raw.at[self.slice].set(jnp.maximum(raw[self.slice] - calib, 0.0))
+        # The spectrum is non-negative, so subtracting the zero-padded patch
+        # and clipping leaves the uncalibrated bins untouched; this fuses
+        # into one elementwise kernel with no gather/scatter. rsp.abs fuses
+        # the magnitude into the pipeline program, so the complex spectrum
+        # is never materialized.
+        calib_full = jnp.pad(
+            calib, (self._pad_doppler, (0, 0), (0, 0), (0, 0)))
+        return _subtract_patch(self.rsp.abs(iq), calib_full)
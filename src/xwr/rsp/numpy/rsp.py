@@ -1,19 +1,78 @@
 """Radar Signal Processing implementations."""
 
+import atexit
+import os
 from abc import ABC
 from collections.abc import Mapping
+from pathlib import Path
 from typing import Literal
 
 import numpy as np
+import pyfftw
 from jaxtyping import Complex64, Float32, Shaped
-from pyfftw import FFTW
+from pyfftw import FFTW, empty_aligned
 
 from xwr.rsp import RSP
+from xwr.rsp.generic import _to_half
+
+# FFTW wisdom (accumulated planning results) is persisted across runs, so
+# plans for previously seen shapes are cheap even in a fresh process.
+_WISDOM_PATH = Path(os.environ.get(
+    "XWR_FFTW_WISDOM", "~/.cache/xwr/fftw_wisdom")).expanduser()
+
+
+def _export_wisdom() -> None:
+    try:
+        _WISDOM_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash or full disk mid-write cannot leave
+        # a truncated file behind for the next import to trip over.
+        tmp = _WISDOM_PATH.with_suffix(".tmp")
+        tmp.write_bytes(b"\x00".join(pyfftw.export_wisdom()))
+        os.replace(tmp, _WISDOM_PATH)
+    except OSError:
+        pass
+
+
+try:
+    pyfftw.import_wisdom(tuple(_WISDOM_PATH.read_bytes().split(b"\x00")))
+except Exception:
+    # Wisdom is only a planning cache; a missing, stale, or corrupt file
+    # (pyfftw raises IndexError on a truncated one) must never break import.
+    pass
+atexit.register(_export_wisdom)
+
+# Steering matrices for DTFT angle axes, keyed by (output size, elements).
+_STEERING: dict[tuple[int, int], np.ndarray] = {}
+
+
+def _next_fast_len(n: int) -> int:
+    """Smallest 7-smooth integer `>= n`.
+
+    FFTW has fast codelets for factors up to 7; sizes with larger prime
+    factors fall back to the much slower Bluestein/Rader paths, so padding
+    a few bins further up is almost always a net win.
+    """
+    while True:
+        m = n
+        for p in (2, 3, 5, 7):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
 
 
 class RSPNumpy(RSP[np.ndarray], ABC):
     """Numpy Radar Signal Processing base class.
 
+    !!! warning "Output buffer reuse"
+
+        Returned arrays are views of scratch buffers owned by this RSP
+        instance, and are only valid until the next call: each call
+        overwrites the previous result in place. Copy (e.g. `np.copy`) any
+        result that must outlive the following frame, as in
+        `spectra = [np.copy(proc(f)) for f in frames]`.
+
     Args:
         window: whether to apply a hanning window. If `bool`, the same option
             is applied to all axes. If `dict`, specify per axis with keys
@@ -22,6 +81,12 @@ class RSPNumpy(RSP[np.ndarray], ABC):
             If an axis is not spacified, it is not padded.
         sample_swap: if `True`, swap the I and Q components when
             un-interleaving IIQQ data.
+        low_precision: if `True`, quantize the MIMO virtual array to
+            half-precision real/imag pairs before the elevation-azimuth FFT.
+        fast_sizes: if `True`, round the configured pad sizes up to the next
+            7-smooth integer so FFTW never takes a slow large-prime code
+            path; the corresponding output axes may then be slightly larger
+            than requested.
     """
 
     def __init__(
@@ -30,33 +95,283 @@ class RSPNumpy(RSP[np.ndarray], ABC):
         size: Mapping[
             Literal["range", "doppler", "azimuth", "elevation"], int] = {},
         sample_swap: bool = False,
+        low_precision: bool = False,
+        fast_sizes: bool = False,
     ) -> None:
-        super().__init__(window=window, size=size, sample_swap=sample_swap)
+        super().__init__(
+            window=window, size=size, sample_swap=sample_swap,
+            low_precision=low_precision)
+        if fast_sizes:
+            self.size = {
+                axis: _next_fast_len(s) for axis, s in self.size.items()}
         self._fft_cache: dict[
-            tuple[tuple[int, ...], tuple[int, ...], np.dtype], FFTW] = {}
+            tuple[tuple[int, ...], tuple[int, ...], np.dtype],
+            tuple[FFTW, np.ndarray, np.ndarray]] = {}
+        self._shift_sign_cache: dict[int, np.ndarray] = {}
+        self._hann_cache: dict[int, np.ndarray] = {}
+        self._factor_cache: dict[
+            tuple, tuple[np.ndarray | None, tuple[int, ...] | None]] = {}
+        self._buffer_cache: dict[
+            tuple[str, tuple[int, ...], np.dtype], np.ndarray] = {}
+
+    def _buffer(
+        self, name: str, shape: tuple[int, ...], dtype: np.dtype | type
+    ) -> np.ndarray:
+        """Reusable zero-initialized scratch buffer, keyed by name and shape.
+
+        Like the FFTW plan cache (whose internal output arrays are already
+        reused across calls), buffers are owned by this RSP instance, and
+        their contents are only valid until the next call; steady-state
+        streaming then allocates nothing per frame. The `name` tag keeps
+        distinct pipeline stages from aliasing buffers of the same shape.
+        """
+        key = (name, shape, np.dtype(dtype))
+        if key not in self._buffer_cache:
+            self._buffer_cache[key] = np.zeros(shape, dtype=dtype)
+        return self._buffer_cache[key]
+
+    def _shift_sign(self, n: int) -> np.ndarray:
+        """Alternating `(-1)**k` sign vector, cached per length.
+
+        Multiplying the input by `(-1)**k` along an even-length axis shifts
+        the corresponding FFT output by `n / 2`, which is equivalent to an
+        `fftshift` along that axis (frequency-shift identity). This lets us
+        fold the shift into the FFT input instead of copying the full
+        (possibly padded) output cube afterwards.
+        """
+        if n not in self._shift_sign_cache:
+            sign = np.ones(n, dtype=np.float32)
+            sign[1::2] = -1.0
+            self._shift_sign_cache[n] = sign
+        return self._shift_sign_cache[n]
+
+    def _hann_vec(self, n: int) -> np.ndarray:
+        """Normalized Hann window vector, cached per length."""
+        if n not in self._hann_cache:
+            hann = np.hanning(n + 2).astype(np.float32)[1:-1]
+            self._hann_cache[n] = hann / np.mean(hann)
+        return self._hann_cache[n]
+
+    def _fft_factor(
+        self, shape: tuple[int, ...],
+        axes: tuple[int, ...],
+        size: tuple[int, ...] | None,
+        shift: tuple[int, ...] | None,
+        window: tuple[int, ...] | None,
+    ) -> tuple[np.ndarray | None, tuple[int, ...] | None]:
+        """Combined elementwise premultiplier for an `fft` call.
+
+        Merges the per-axis Hann windows (extended with ones over any
+        zero-padded tail) with the even-axis shift signs (frequency-shift
+        identity; see `_shift_sign`) into one broadcastable factor, so all
+        of them apply in the single multiply into the FFT input buffer.
+        Odd-length shift axes are returned for an output `fftshift`.
+        """
+        padded = list(shape)
+        if size is not None:
+            for axis, s in zip(axes, size):
+                padded[axis] = s
+
+        vecs: dict[int, np.ndarray] = {}
+        if window:
+            for axis in window:
+                vec = self._hann_vec(shape[axis])
+                if padded[axis] > vec.size:
+                    vec = np.concatenate([
+                        vec, np.ones(padded[axis] - vec.size, np.float32)])
+                elif padded[axis] < vec.size:
+                    vec = vec[:padded[axis]]
+                vecs[axis] = vec
+
+        shift_post: tuple[int, ...] | None = None
+        if shift:
+            shift_post = tuple(
+                axis for axis in shift if padded[axis] % 2 != 0)
+            for axis in shift:
+                if padded[axis] % 2 == 0:
+                    sign = self._shift_sign(padded[axis])
+                    vecs[axis] = vecs[axis] * sign if axis in vecs else sign
+
+        factor: np.ndarray | None = None
+        for axis, vec in vecs.items():
+            broadcast: list[None | slice] = [None] * len(shape)
+            broadcast[axis] = slice(None)
+            v = vec[tuple(broadcast)]
+            factor = v if factor is None else factor * v
+        return factor, shift_post or None
 
     def fft(
         self, array: Complex64[np.ndarray, "..."] | Float32[np.ndarray, "..."],
         axes: tuple[int, ...],
         size: tuple[int, ...] | None = None,
-        shift: tuple[int, ...] | None = None
+        shift: tuple[int, ...] | None = None,
+        window: tuple[int, ...] | None = None,
     ) -> Complex64[np.ndarray, "..."]:
+        fkey = (array.shape, axes, size, shift, window)
+        if fkey not in self._factor_cache:
+            self._factor_cache[fkey] = self._fft_factor(
+                array.shape, axes, size, shift, window)
+        factor, shift_post = self._factor_cache[fkey]
+
+        # Zero-padding happens by writing the data region of the (already
+        # padded) FFT input buffer; only downsizing still slices the input.
+        data_region: list[slice] = [slice(None)] * array.ndim
+        padded_shape = list(array.shape)
         if size is not None:
             for axis, s in zip(axes, size):
-                array = self.pad(array, axis, s)
+                if s < array.shape[axis]:
+                    array = self.pad(array, axis, s)
+                elif s > array.shape[axis]:
+                    padded_shape[axis] = s
+                    data_region[axis] = slice(0, array.shape[axis])
+
+        # The plan is insensitive to the leading batch size (axis 0 is never
+        # transformed in this pipeline), so key on the trailing shape only:
+        # a shorter final batch reuses the existing plan by zero-filling the
+        # tail rows, instead of paying for a fresh FFTW_MEASURE plan. A
+        # larger batch still replans (and replaces the cached capacity).
+        batched = 0 not in axes
+        cap_shape = tuple(padded_shape)
+        key: tuple = (
+            (cap_shape[1:], axes, array.dtype) if batched
+            else (cap_shape, axes, array.dtype))
+
+        # Plan against SIMD-aligned scratch buffers owned by the cache, then
+        # execute directly: one copy into the planned input buffer per call
+        # (skipped when the caller already writes into it), instead of
+        # FFTW.__call__'s copy plus per-call argument validation. The output
+        # buffer is reused across calls, like the rest of the scratch state.
+        entry = self._fft_cache.get(key)
+        if entry is None or (batched and entry[1].shape[0] < cap_shape[0]):
+            out_shape = cap_shape
+            if array.dtype == np.float32:
+                out_shape = (*out_shape[:-1], out_shape[-1] // 2 + 1)
+            in_buf = empty_aligned(cap_shape, array.dtype)
+            out_buf = empty_aligned(out_shape, np.complex64)
+            plan = FFTW(
+                in_buf, out_buf, axes=axes,
+                flags=("FFTW_MEASURE", "FFTW_DESTROY_INPUT"),
+                threads=os.cpu_count() or 1)
+            self._fft_cache[key] = (plan, in_buf, out_buf)
+
+        plan, in_buf, out_buf = self._fft_cache[key]
+        if batched and in_buf.shape[0] > cap_shape[0]:
+            # Undersized batch on an oversized plan: the tail rows become a
+            # pad slab (zeroed below) and the extra row transforms are the
+            # price of skipping a replan.
+            data_region[0] = slice(0, cap_shape[0])
+        # Re-zero only the pad slabs (FFTW_DESTROY_INPUT may scribble over
+        # the buffer during execute, so they cannot be assumed to persist).
+        for axis, region in enumerate(data_region):
+            if region != slice(None):
+                slab: list[slice] = [slice(None)] * in_buf.ndim
+                slab[axis] = slice(region.stop, None)
+                in_buf[tuple(slab)] = 0
+
+        dst = in_buf[tuple(data_region)]
+        if factor is not None:
+            # Fuse windowing/shift signs with the input copy: one pass over
+            # the cube instead of one per multiplier plus the copy itself.
+            np.multiply(array, factor[tuple(
+                region if factor.shape[axis] > 1 else slice(None)
+                for axis, region in enumerate(data_region))], out=dst)
+        elif array is not in_buf:
+            np.copyto(dst, array)
+        plan.execute()
+        out = (
+            out_buf[:cap_shape[0]]
+            if batched and out_buf.shape[0] > cap_shape[0] else out_buf)
+        return np.fft.fftshift(out, axes=shift_post) if shift_post else out
+
+    def warmup(
+        self, shape: tuple[int, ...], dtype: np.dtype | type | None = None
+    ) -> None:
+        """Specialize the pipeline for a fixed input shape ahead of time.
+
+        Radar models have fixed axis sizes per configuration, so all of the
+        per-shape state (FFTW plans, window and shift-sign vectors, scratch
+        buffers) can be built before streaming starts. FFTW planning in
+        particular is slow, and would otherwise stall on the first frame;
+        after warmup, calls for this shape are straight cache hits.
+
+        Args:
+            shape: input shape, as passed to `__call__`. The shape and dtype
+                must match what streaming will deliver: interleaved int16 IQ
+                input pairs the doubled sample axis with `dtype=np.int16`,
+                while complex input uses the un-doubled shape.
+            dtype: input dtype; defaults to `complex64` for IQ radars and
+                `float32` for in-phase-only radars.
+        """
+        if dtype is None:
+            dtype = np.complex64 if self.SAMPLE_TYPE == "IQ" else np.float32
+        self(np.zeros(shape, dtype=dtype))
+
+    def doppler_range(
+        self, x: Complex64[np.ndarray, "#batch doppler tx rx range"]
+            | Float32[np.ndarray, "#batch doppler tx rx range"]
+    ) -> Complex64[np.ndarray, "#batch doppler2 tx rx range2"]:
+        """Calculate range-doppler spectrum from time signal data.
+
+        The doppler/range Hann windows are passed through to `fft`, which
+        folds them (with the doppler shift sign) into the copy into the FFT
+        input buffer, rather than multiplying the full cube separately per
+        window.
+
+        Args:
+            x: IQ (complex64) or in-phase-only (float32) data.
 
-        key = (array.shape, axes, array.dtype)
-        out_shape = array.shape
-        if array.dtype == np.float32:
-            out_shape = (*out_shape[:-1], out_shape[-1] // 2 + 1)
+        Returns:
+            Computed range-doppler spectrum, with windowing if specified.
+        """
+        axes: tuple[tuple[int, Literal["doppler", "range"]], ...] = (
+            (1, "doppler"), (4, "range"))
+        window = tuple(
+            axis for axis, name in axes
+            if self.window.get(name, self._default_window))
+
+        if self.SAMPLE_TYPE == "I":
+            # Double range bins for in-phase-only.
+            nrange = x.shape[-1] // 2
+            range_bins = self.size.get("range", nrange) * 2
+        else:
+            range_bins = self.size.get("range", x.shape[4])
+
+        return self.fft(
+            x, axes=(1, 4), shift=(1,),
+            size=(self.size.get("doppler", x.shape[1]), range_bins),
+            window=window or None)
+
+    def elevation_azimuth(
+        self, rd: Complex64[np.ndarray, "#batch doppler tx rx range"]
+    ) -> Complex64[np.ndarray, "#batch doppler el az range"]:
+        """Calculate elevation-azimuth spectrum from range-doppler spectrum.
 
-        if key not in self._fft_cache:
-            self._fft_cache[key] = FFTW(
-                np.copy(array),
-                np.zeros(out_shape, dtype=np.complex64), axes=axes)
+        As in `doppler_range`, the angle-axis windows fold into the FFT
+        input copy instead of separate full passes over the virtual array.
 
-        fftd = self._fft_cache[key](array)
-        return np.fft.fftshift(fftd, axes=shift) if shift else fftd
+        Args:
+            rd: range-doppler spectrum.
+
+        Returns:
+            Computed elevation-azimuth spectrum, with windowing and padding if
+                specified.
+        """
+        mimo = self.mimo_virtual_array(rd)
+        if self.low_precision:
+            mimo = _to_half(mimo)
+
+        axes: tuple[tuple[int, Literal["elevation", "azimuth"]], ...] = (
+            (2, "elevation"), (3, "azimuth"))
+        window = tuple(
+            axis for axis, name in axes
+            if self.window.get(name, self._default_window))
+
+        return self.fft(
+            mimo, axes=(2, 3), shift=(2, 3),
+            size=(
+                self.size.get("elevation", mimo.shape[2]),
+                self.size.get("azimuth", mimo.shape[3])),
+            window=window or None)
 
     @staticmethod
     def pad(
@@ -74,15 +389,14 @@ class RSPNumpy(RSP[np.ndarray], ABC):
             zeros = np.zeros(shape, dtype=x.dtype)
             return np.concatenate([x, zeros], axis=axis)
 
-    @staticmethod
     def hann(
+        self,
         x: Complex64[np.ndarray, "..."] | Float32[np.ndarray, "..."],
         axis: int
     ) -> Complex64[np.ndarray, "..."] | Float32[np.ndarray, "..."]:
-        hann = np.hanning(x.shape[axis] + 2).astype(np.float32)[1:-1]
         broadcast: list[None | slice] = [None] * x.ndim
         broadcast[axis] = slice(None)
-        return x * (hann / np.mean(hann))[tuple(broadcast)]
+        return x * self._hann_vec(x.shape[axis])[tuple(broadcast)]
 
 
 class AWR1843AOP(RSPNumpy):
@@ -141,6 +455,14 @@ class AWR1843Boost(RSPNumpy):
             un-interleaving IIQQ data.
     """
 
+    # Output lane -> flattened (tx, rx) input lane for the 2x8 virtual
+    # array; -1 marks empty lanes, which are re-zeroed after the gather.
+    _VIRT_IDX = np.array(
+        [-1, -1, 4, 5, 6, 7, -1, -1, 0, 1, 2, 3, 8, 9, 10, 11],
+        dtype=np.intp)
+    _VIRT_GATHER = np.maximum(_VIRT_IDX, 0)
+    _VIRT_HOLES = np.flatnonzero(_VIRT_IDX < 0)
+
     def mimo_virtual_array(
         self, rd: Complex64[np.ndarray, "#batch doppler tx rx range"]
     ) -> Complex64[np.ndarray, "#batch doppler el az range"]:
@@ -149,10 +471,15 @@ class AWR1843Boost(RSPNumpy):
             raise ValueError(
                 f"Expected (tx, rx)=3x4, got tx={tx} and rx={rx}.")
 
-        mimo = np.zeros((batch, doppler, 2, 8, range), dtype=np.complex64)
-        mimo[:, :, 0, 2:6, :] = rd[:, :, 1, :, :]
-        mimo[:, :, 1, 0:4, :] = rd[:, :, 0, :, :]
-        mimo[:, :, 1, 4:8, :] = rd[:, :, 2, :, :]
+        # One linear gather over the antenna lanes instead of per-TX slice
+        # writes; only the hole lanes are zeroed, not the whole cube.
+        mimo = self._buffer(
+            "mimo", (batch, doppler, 2, 8, range), np.complex64)
+        flat = mimo.reshape(batch, doppler, 16, range)
+        np.take(
+            rd.reshape(batch, doppler, tx * rx, range),
+            self._VIRT_GATHER, axis=2, out=flat)
+        flat[:, :, self._VIRT_HOLES] = 0
         return mimo
 
 
@@ -235,16 +562,30 @@ class AWRL6844EVM(RSPNumpy):
     _PHASE = np.array(
         [[-1, -1, 1, 1], [-1, -1, 1, 1], [1, 1, -1, -1], [1, 1, -1, -1]],
         dtype=np.float32)
+    # Flat-lane gather table and the lanes to negate, merged from _TX/_RX
+    # and _PHASE so the remap is one gather plus in-place sign flips.
+    _VIRT_GATHER = (_TX * 4 + _RX).reshape(-1)
+    _VIRT_NEG = np.flatnonzero(_PHASE.reshape(-1) < 0)
 
     def mimo_virtual_array(
         self, rd: Complex64[np.ndarray, "#batch doppler tx rx range"]
     ) -> Complex64[np.ndarray, "#batch doppler el az range"]:
-        _, _, tx, rx, _ = rd.shape
+        batch, doppler, tx, rx, range = rd.shape
         if tx != 4 or rx != 4:
             raise ValueError(
                 f"Expected (tx, rx)=4x4, got tx={tx} and rx={rx}.")
 
-        return rd[:, :, self._TX, self._RX, :] * self._PHASE[None, None, :, :, None]
+        # Gather into the cached buffer, then negate only the out-of-phase
+        # lanes in place instead of a broadcast multiply over the full cube.
+        mimo = self._buffer(
+            "mimo", (batch, doppler, 4, 4, range), np.complex64)
+        flat = mimo.reshape(batch, doppler, 16, range)
+        np.take(
+            rd.reshape(batch, doppler, 16, range),
+            self._VIRT_GATHER, axis=2, out=flat)
+        for lane in self._VIRT_NEG:
+            np.negative(flat[:, :, lane], out=flat[:, :, lane])
+        return mimo
 
 
 class AWR2944EVM(RSPNumpy):
@@ -270,16 +611,28 @@ class AWR2944EVM(RSPNumpy):
 
     SAMPLE_TYPE = "I"
 
+    # Output lane -> flattened (tx, rx) input lane for the 2x12 virtual
+    # array; -1 marks empty lanes, which are re-zeroed after the gather.
+    _VIRT_IDX = np.array(
+        [-1, -1, 4, 5, 6, 7, -1, -1, -1, -1, -1, -1,
+         0, 1, 2, 3, 8, 9, 10, 11, 12, 13, 14, 15],
+        dtype=np.intp)
+    _VIRT_GATHER = np.maximum(_VIRT_IDX, 0)
+    _VIRT_HOLES = np.flatnonzero(_VIRT_IDX < 0)
+
     def mimo_virtual_array(
         self, rd: Complex64[np.ndarray, "#batch doppler tx rx range"]
     ) -> Complex64[np.ndarray, "#batch doppler el az range"]:
         batch, doppler, tx, rx, range = rd.shape
-        mimo = np.zeros((batch, doppler, 2, 12, range), dtype=np.complex64)
-        mimo[:, :, 0, 2:6, :] = rd[:, :, 1, :, :]
-        mimo[:, :, 1, 0:4, :] = rd[:, :, 0, :, :]
-        mimo[:, :, 1, 4:8, :] = rd[:, :, 2, :, :]
-        mimo[:, :, 1, 8:12, :] = rd[:, :, 3, :, :]
-
+        # One linear gather over the antenna lanes instead of per-TX slice
+        # writes; only the hole lanes are zeroed, not the whole cube.
+        mimo = self._buffer(
+            "mimo", (batch, doppler, 2, 12, range), np.complex64)
+        flat = mimo.reshape(batch, doppler, 24, range)
+        np.take(
+            rd.reshape(batch, doppler, tx * rx, range),
+            self._VIRT_GATHER, axis=2, out=flat)
+        flat[:, :, self._VIRT_HOLES] = 0
         return mimo
 
     def elevation_azimuth(
@@ -303,23 +656,48 @@ class AWR2944EVM(RSPNumpy):
         """
         mimo = self.mimo_virtual_array(rd)
 
-        if self.window.get("elevation", self._default_window):
-            mimo = self.hann(mimo, 2)
-        if self.window.get("azimuth", self._default_window):
-            mimo = self.hann(mimo, 3)
-
+        axes: tuple[tuple[int, Literal["elevation", "azimuth"]], ...] = (
+            (2, "elevation"), (3, "azimuth"))
+        window = tuple(
+            axis for axis, name in axes
+            if self.window.get(name, self._default_window))
+        if self.low_precision:
+            mimo = _to_half(mimo)
+
+        # Both angle windows fold into the azimuth FFT input copy (the
+        # elevation window is elementwise per lane, so it commutes with the
+        # axis-3 transform); no separate windowed temporaries are allocated.
         az_size = self.size.get("azimuth", mimo.shape[3])
-        spectrum = self.fft(mimo, axes=(3,), shift=(3,), size=(az_size,))
+        spectrum = self.fft(
+            mimo, axes=(3,), shift=(3,), size=(az_size,),
+            window=window or None)
 
         el_size = self.size.get("elevation", mimo.shape[2])
-        sin_theta = np.linspace(-1, 1, el_size)
-        el_elements = np.arange(mimo.shape[2])
-        phases = -2j * np.pi * 0.8 * np.outer(sin_theta, el_elements)
-        steering_matrix = np.exp(phases).astype(np.complex64)
-
-        el_az_spectrum = np.einsum(
-            'bdear,ke->bdkar',
-            spectrum, steering_matrix, optimize=True
-        )
-
-        return el_az_spectrum
+        key = (el_size, mimo.shape[2])
+        if key not in _STEERING:
+            sin_theta = np.linspace(-1, 1, el_size)
+            el_elements = np.arange(mimo.shape[2])
+            phases = -2j * np.pi * 0.8 * np.outer(sin_theta, el_elements)
+            _STEERING[key] = np.exp(phases).astype(np.complex64)
+
+        steering = _STEERING[key]
+        if spectrum.shape[2] == 2:
+            # With only two elevation lanes, the DTFT is just two broadcast
+            # multiply-adds per output bin; writing straight into a reused
+            # buffer skips the transpose copies the matmul path makes for
+            # its non-contiguous operands.
+            batch, doppler, _, az, rng = spectrum.shape
+            out = self._buffer(
+                "dtft", (batch, doppler, el_size, az, rng), np.complex64)
+            tap = self._buffer(
+                "dtft_tap", (batch, doppler, az, rng), np.complex64)
+            for k in range(el_size):
+                np.multiply(spectrum[:, :, 0], steering[k, 0], out=out[:, :, k])
+                np.multiply(spectrum[:, :, 1], steering[k, 1], out=tap)
+                out[:, :, k] += tap
+            return out
+
+        # The elevation DTFT is a small complex matmul over the trailing
+        # axis, which dispatches to BLAS instead of einsum path selection.
+        el_az_spectrum = np.moveaxis(spectrum, 2, -1) @ steering.T
+        return np.moveaxis(el_az_spectrum, -1, 2)
@@ -1,18 +1,32 @@
 """Radar Signal Processing implementations."""
 
 from abc import ABC
+from collections.abc import Mapping
+from typing import Literal
 
 import numpy as np
 import torch
-from jaxtyping import Complex64, Float32, Shaped
+import torch.nn.functional as F  # noqa: N812
+from jaxtyping import Complex64, Float32, Int16, Shaped
+from jaxtyping._config import config as jaxtyping_config
 from torch import Tensor
 
 from xwr.rsp import RSP
+from xwr.rsp.generic import _to_half
 
 
 class RSPTorch(RSP[Tensor], ABC):
     """Base Radar Signal Processing with common functionality.
 
+    !!! warning "Output buffer reuse"
+
+        In inference mode (no gradients tracked), returned tensors are
+        views of buffers owned by this RSP instance, and are only valid
+        until the next call: each call overwrites the previous result in
+        place. `.clone()` any result that must outlive the following
+        frame. When gradients are tracked, every call returns a fresh
+        tensor.
+
     Args:
         window: whether to apply a hanning window. If `bool`, the same option
             is applied to all axes. If `dict`, specify per axis with keys
@@ -21,22 +35,150 @@ class RSPTorch(RSP[Tensor], ABC):
             If an axis is not specified, it is not padded.
         sample_swap: if `True`, swap the I and Q components when
             un-interleaving IIQQ data.
+        compile: if `True`, run the pipeline through
+            `torch.compile(..., dynamic=False, mode="reduce-overhead")` so
+            the pointwise stages (windows, shift signs, remap fills) fuse
+            into generated kernels and per-frame launch overhead amortizes
+            at the fixed shapes of a radar configuration. Leave `False` for
+            gradient use: CUDA-graph capture does not compose with autograd.
     """
 
+    def __init__(
+        self, window: bool | Mapping[
+            Literal["range", "doppler", "azimuth", "elevation"], bool] = False,
+        size: Mapping[
+            Literal["range", "doppler", "azimuth", "elevation"], int] = {},
+        sample_swap: bool = False,
+        low_precision: bool = False,
+        compile: bool = False,
+    ) -> None:
+        super().__init__(
+            window=window, size=size, sample_swap=sample_swap,
+            low_precision=low_precision)
+        # Device-resident constant tensors (gather tables, phase patterns),
+        # keyed by (name, device) so they upload to each device only once.
+        self._const_cache: dict[tuple[str, torch.device], Tensor] = {}
+        self._compiled = compile
+        self._process = (
+            torch.compile(
+                super().__call__, dynamic=False, mode="reduce-overhead")
+            if compile else super().__call__)
+
+    def __call__(
+        self, x: Complex64[Tensor, "#batch doppler tx rx _range"]
+            | Float32[Tensor, "#batch doppler tx rx _range"]
+            | Int16[Tensor, "#batch doppler tx rx _range"]
+    ) -> Complex64[Tensor, "#batch doppler2 el az _range"]:
+        """Process time signal data to compute elevation-azimuth spectrum.
+
+        Runs the (optionally compiled) pipeline; see
+        [`RSP.__call__`][xwr.rsp.RSP].
+
+        Args:
+            x: IQ data in complex or interleaved int16 IQ format, or
+                in-phase-only data in float32 format.
+
+        Returns:
+            Computed doppler-elevation-azimuth-range spectrum.
+        """
+        if self._compiled:
+            # Dynamo cannot trace the jaxtyping/beartype wrappers on the
+            # pipeline stages, so suspend the runtime checks while inside
+            # the compiled region; this entry point is still checked.
+            prev = jaxtyping_config.jaxtyping_disable
+            jaxtyping_config.update("jaxtyping_disable", True)
+            try:
+                return self._process(x)
+            finally:
+                jaxtyping_config.update("jaxtyping_disable", prev)
+        return self._process(x)
+
+    def _const(
+        self, name: str, value: np.ndarray, device: torch.device
+    ) -> Tensor:
+        key = (name, device)
+        if key not in self._const_cache:
+            self._const_cache[key] = torch.from_numpy(value).to(device)
+        return self._const_cache[key]
+
+    def _frame_buffer(
+        self, name: str, shape: tuple[int, ...], dtype: torch.dtype,
+        device: torch.device,
+    ) -> Tensor:
+        """Reusable zeroed output buffer for inference-mode streaming.
+
+        Contents are only valid until the next call with the same shape and
+        device, like the numpy backend's scratch buffers; lanes that are
+        never written stay zero across calls. Callers must fall back to a
+        fresh allocation when gradients are being tracked, since in-place
+        writes into a reused tensor would cross frame graph boundaries.
+        """
+        key = (f"{name}{shape}{dtype}", device)
+        if key not in self._const_cache:
+            self._const_cache[key] = torch.zeros(
+                shape, dtype=dtype, device=device)
+        return self._const_cache[key]
+
+    def _shift_sign(self, n: int, device: torch.device) -> Tensor:
+        """Alternating `(-1)**k` sign vector, cached per device.
+
+        Multiplying the input by `(-1)**k` along an axis whose transform
+        length is even shifts the FFT output by `n / 2` (frequency-shift
+        identity), which is exactly an `fftshift` along that axis — without
+        the full spectrum read+write that `fftshift` costs.
+        """
+        name = f"sign{n}"
+        if (name, device) not in self._const_cache:
+            sign = np.ones(n, dtype=np.float32)
+            sign[1::2] = -1.0
+            self._const(name, sign, device)
+        return self._const_cache[(name, device)]
+
     def fft(
         self, array: Complex64[Tensor, "..."] | Float32[Tensor, "..."],
         axes: tuple[int, ...],
         size: tuple[int, ...] | None = None,
         shift: tuple[int, ...] | None = None
     ) -> Complex64[Tensor, "..."]:
+        # Fold the shift of even-length axes into a pointwise input sign
+        # (frequency-shift identity; see `_shift_sign`); the sign over the
+        # unpadded samples is sufficient since any padded tail is zero.
+        # Odd-length axes fall back to an output fftshift.
+        shift_post: tuple[int, ...] | None = None
+        if shift is not None:
+            shift_post = tuple(
+                axis for axis in shift
+                if (size[axes.index(axis)] if size is not None
+                    else array.shape[axis]) % 2 != 0)
+            for axis in shift:
+                if axis in shift_post:
+                    continue
+                sign = self._shift_sign(array.shape[axis], array.device)
+                broadcast: list[None | slice] = [None] * array.ndim
+                broadcast[axis] = slice(None)
+                array = array * sign[tuple(broadcast)]
+
+        # In inference mode the transform writes into a cached per-shape
+        # output buffer, so steady-state streaming skips the per-frame
+        # allocation and keeps the output address stable for CUDA graphs.
+        out: Tensor | None = None
+        if not (torch.is_grad_enabled() and array.requires_grad):
+            shape = list(array.shape)
+            if size is not None:
+                for axis, s in zip(axes, size):
+                    shape[axis] = s
+            if array.dtype == torch.float32:
+                shape[axes[-1]] = shape[axes[-1]] // 2 + 1
+            out = self._frame_buffer(
+                f"fft{axes}", tuple(shape), torch.complex64, array.device)
+
         if array.dtype == torch.float32:
-            fftd = torch.fft.rfftn(array, s=size, dim=axes)
-        else:
-            fftd = torch.fft.fftn(array, s=size, dim=axes)
-        if shift is None:
-            return fftd
+            fftd = torch.fft.rfftn(array, s=size, dim=axes, out=out)
         else:
-            return torch.fft.fftshift(fftd, dim=shift)
+            fftd = torch.fft.fftn(array, s=size, dim=axes, out=out)
+        if shift_post:
+            return torch.fft.fftshift(fftd, dim=shift_post)
+        return fftd
 
     @staticmethod
     def pad(
@@ -47,22 +189,67 @@ class RSPTorch(RSP[Tensor], ABC):
                 f"Cannot zero-pad axis {axis} to target size {size}, which is "
                 f"less than or equal the current size {x.shape[axis]}.")
 
-        shape = list(x.shape)
-        shape[axis] = size - x.shape[axis]
-        zeros = torch.zeros(shape, dtype=x.dtype, device=x.device)
+        # F.pad's spec is last-axis-first (before, after) pairs; one fused
+        # kernel instead of a zeros allocation plus concatenation copy.
+        spec = [0] * (2 * x.ndim)
+        spec[2 * (x.ndim - 1 - axis) + 1] = size - x.shape[axis]
+        return F.pad(x, spec)
 
-        return torch.concatenate([x, zeros], dim=axis)
+    def _combined_window(self, x: Tensor, axes: tuple[int, ...]) -> Tensor:
+        """Broadcast product of per-axis Hann windows, cached per device.
+
+        Multi-axis windowing then costs a single elementwise multiply over
+        the cube instead of one full pass per windowed axis.
+        """
+        name = "hann" + "x".join(f"{a}:{x.shape[a]}" for a in axes)
+        if (name, x.device) not in self._const_cache:
+            factor: np.ndarray | None = None
+            for axis in axes:
+                hann = np.hanning(x.shape[axis] + 2).astype(np.float32)[1:-1]
+                shape = [1] * x.ndim
+                shape[axis] = -1
+                vec = (hann / np.mean(hann)).reshape(shape)
+                factor = vec if factor is None else factor * vec
+            assert factor is not None
+            self._const(name, factor, x.device)
+        return self._const_cache[(name, x.device)]
+
+    def _window_doppler_range(
+        self, x: Complex64[Tensor, "#batch doppler tx rx range"]
+            | Float32[Tensor, "#batch doppler tx rx range"]
+    ) -> Complex64[Tensor, "#batch doppler tx rx range"] \
+            | Float32[Tensor, "#batch doppler tx rx range"]:
+        table: tuple[tuple[int, Literal["doppler", "range"]], ...] = (
+            (1, "doppler"), (4, "range"))
+        axes = tuple(
+            axis for axis, name in table
+            if self.window.get(name, self._default_window))
+        return x * self._combined_window(x, axes) if axes else x
+
+    def _window_elevation_azimuth(
+        self, mimo: Complex64[Tensor, "#batch doppler el az range"]
+    ) -> Complex64[Tensor, "#batch doppler el az range"]:
+        table: tuple[tuple[int, Literal["elevation", "azimuth"]], ...] = (
+            (2, "elevation"), (3, "azimuth"))
+        axes = tuple(
+            axis for axis, name in table
+            if self.window.get(name, self._default_window))
+        return mimo * self._combined_window(mimo, axes) if axes else mimo
 
-    @staticmethod
     def hann(
-        x: Complex64[Tensor, "..."] | Float32[Tensor, "..."], axis: int
+        self, x: Complex64[Tensor, "..."] | Float32[Tensor, "..."], axis: int
     ) -> Complex64[Tensor, "..."] | Float32[Tensor, "..."]:
-        hann = np.hanning(x.shape[axis] + 2).astype(np.float32)[1:-1]
+        # The normalized window is a device-resident constant like the
+        # gather tables, so streaming frames skip the per-call numpy build
+        # and host-to-device upload.
+        name = f"hann{x.shape[axis]}"
+        if (name, x.device) not in self._const_cache:
+            hann = np.hanning(x.shape[axis] + 2).astype(np.float32)[1:-1]
+            self._const(name, hann / np.mean(hann), x.device)
+        window = self._const_cache[(name, x.device)]
         broadcast: list[None | slice] = [None] * x.ndim
         broadcast[axis] = slice(None)
-        window = torch.from_numpy(
-            (hann / np.mean(hann))[tuple(broadcast)]).to(x.device)
-        return x * window
+        return x * window[tuple(broadcast)]
 
 
 class AWR1843AOP(RSPTorch):
@@ -98,6 +285,46 @@ class AWR1843AOP(RSPTorch):
 
         return torch.swapaxes(rd, 2, 3)
 
+    def elevation_azimuth(
+        self, rd: Complex64[Tensor, "#batch doppler tx rx range"]
+    ) -> Complex64[Tensor, "#batch doppler el az range"]:
+        """Calculate elevation-azimuth spectrum from range-doppler spectrum.
+
+        The AOP virtual array is just the `(tx, rx)` grid transposed, so
+        rather than transposing before the FFT (which would make the FFT
+        read strided memory or trigger an internal copy), window and
+        transform in the native layout with a swapped axis spec; only the
+        output axes are reordered, which is a stride-only view.
+
+        Args:
+            rd: range-doppler spectrum.
+
+        Returns:
+            Computed elevation-azimuth spectrum, with windowing and padding if
+                specified.
+        """
+        _, _, tx, rx, _ = rd.shape
+        if tx != 3 or rx != 4:
+            raise ValueError(
+                f"Expected (tx, rx)=3x4, got tx={tx} and rx={rx}.")
+
+        table: tuple[tuple[int, Literal["elevation", "azimuth"]], ...] = (
+            (3, "elevation"), (2, "azimuth"))
+        axes = tuple(
+            axis for axis, name in table
+            if self.window.get(name, self._default_window))
+        if axes:
+            rd = rd * self._combined_window(rd, axes)
+        if self.low_precision:
+            rd = _to_half(rd)
+
+        spectrum = self.fft(
+            rd, axes=(3, 2), shift=(3, 2),
+            size=(
+                self.size.get("elevation", rd.shape[3]),
+                self.size.get("azimuth", rd.shape[2])))
+        return torch.swapaxes(spectrum, 2, 3)
+
 
 class AWR1843Boost(RSPTorch):
     """Radar Signal Processing for AWR1843Boost.
@@ -129,11 +356,20 @@ class AWR1843Boost(RSPTorch):
             raise ValueError(
                 f"Expected (tx, rx)=3x4, got tx={tx} and rx={rx}.")
 
-        zeros = torch.zeros(
-            (batch, doppler, 2, range), dtype=rd.dtype, device=rd.device)
-        el_0 = torch.cat([zeros, rd[:, :, 1, :, :], zeros], dim=2)
-        el_1 = torch.cat([rd[:, :, 0, :, :], rd[:, :, 2, :, :]], dim=2)
-        return torch.stack([el_0, el_1], dim=2)
+        # Single zeroed destination filled by contiguous slice writes: one
+        # allocation and one pass over the data, with no intermediate
+        # concatenation or gather copies. Slice assignment is differentiable.
+        # In inference mode the destination persists across frames (holes
+        # stay zero), removing even the allocation and zero fill.
+        if torch.is_grad_enabled() and rd.requires_grad:
+            out = rd.new_zeros((batch, doppler, 2, 8, range))
+        else:
+            out = self._frame_buffer(
+                "mimo", (batch, doppler, 2, 8, range), rd.dtype, rd.device)
+        out[:, :, 0, 2:6] = rd[:, :, 1]
+        out[:, :, 1, 0:4] = rd[:, :, 0]
+        out[:, :, 1, 4:8] = rd[:, :, 2]
+        return out
 
 
 class AWR1642Boost(RSPTorch):
@@ -168,7 +404,9 @@ class AWR1642Boost(RSPTorch):
                 raise ValueError(
                     f"Expected (tx, rx)=3x4 in 1843Boost -> 1642Boost "
                     f"emulation, got tx={tx} and rx={rx}.")
-            rd = rd[:, :, [0, 2], :, :]
+            # stack of two slices instead of list indexing: no per-call
+            # index-tensor construction/upload, just one contiguous copy.
+            rd = torch.stack((rd[:, :, 0], rd[:, :, 2]), dim=2)
         else:
             if tx != 2 or rx != 4:
                 raise ValueError(
@@ -208,6 +446,16 @@ class AWRL6844EVM(RSPTorch):
 
     SAMPLE_TYPE = "I"
 
+    # TX and RX indices (0-based) for each (elevation, azimuth) position,
+    # merged into a flat-lane gather table; TX2 and TX4 (1-indexed) are
+    # 180° out of phase.
+    _TX = np.array([[1, 1, 0, 0], [1, 1, 0, 0], [2, 2, 3, 3], [2, 2, 3, 3]])
+    _RX = np.array([[0, 3, 0, 3], [1, 2, 1, 2], [0, 3, 0, 3], [1, 2, 1, 2]])
+    _VIRT_IDX = (_TX * 4 + _RX).reshape(-1).astype(np.int64)
+    _PHASE = np.array(
+        [[-1, -1, 1, 1], [-1, -1, 1, 1], [1, 1, -1, -1], [1, 1, -1, -1]],
+        dtype=np.float32)
+
     def mimo_virtual_array(
         self, rd: Complex64[Tensor, "#batch doppler tx rx range"]
     ) -> Complex64[Tensor, "#batch doppler el az range"]:
@@ -216,16 +464,12 @@ class AWRL6844EVM(RSPTorch):
             raise ValueError(
                 f"Expected (tx, rx)=4x4, got tx={tx} and rx={rx}.")
 
-        tx_idx = torch.tensor(
-            [[1, 1, 0, 0], [1, 1, 0, 0], [2, 2, 3, 3], [2, 2, 3, 3]],
-            device=rd.device)
-        rx_idx = torch.tensor(
-            [[0, 3, 0, 3], [1, 2, 1, 2], [0, 3, 0, 3], [1, 2, 1, 2]],
-            device=rd.device)
-        phase = torch.tensor(
-            [[-1, -1, 1, 1], [-1, -1, 1, 1], [1, 1, -1, -1], [1, 1, -1, -1]],
-            dtype=torch.float32, device=rd.device)
-        return rd[:, :, tx_idx, rx_idx, :] * phase[None, None, :, :, None]
+        gathered = torch.index_select(
+            rd.reshape(*rd.shape[:2], 16, rd.shape[-1]), 2,
+            self._const("virt_idx", self._VIRT_IDX, rd.device)
+        ).reshape(*rd.shape[:2], 4, 4, rd.shape[-1])
+        phase = self._const("phase", self._PHASE, rd.device)
+        return gathered * phase[None, None, :, :, None]
 
 
 class AWR2944EVM(RSPTorch):
@@ -255,17 +499,21 @@ class AWR2944EVM(RSPTorch):
         self, rd: Complex64[Tensor, "#batch doppler tx rx range"]
     ) -> Complex64[Tensor, "#batch doppler el az range"]:
         batch, doppler, tx, rx, range = rd.shape
-        zeros_2 = torch.zeros(
-            (batch, doppler, 1, 2, range),
-            dtype=torch.complex64, device=rd.device)
-        zeros_6 = torch.zeros(
-            (batch, doppler, 1, 6, range),
-            dtype=torch.complex64, device=rd.device)
-        row0 = torch.cat([zeros_2, rd[:, :, 1:2, :, :], zeros_6], dim=3)
-        row1 = torch.cat(
-            [rd[:, :, 0:1, :, :], rd[:, :, 2:3, :, :], rd[:, :, 3:4, :, :]],
-            dim=3)
-        return torch.cat([row0, row1], dim=2)
+        # Single zeroed destination filled by contiguous slice writes: one
+        # allocation and one pass over the data, with no intermediate
+        # concatenation or gather copies. Slice assignment is differentiable.
+        # In inference mode the destination persists across frames (holes
+        # stay zero), removing even the allocation and zero fill.
+        if torch.is_grad_enabled() and rd.requires_grad:
+            out = rd.new_zeros((batch, doppler, 2, 12, range))
+        else:
+            out = self._frame_buffer(
+                "mimo", (batch, doppler, 2, 12, range), rd.dtype, rd.device)
+        out[:, :, 0, 2:6] = rd[:, :, 1]
+        out[:, :, 1, 0:4] = rd[:, :, 0]
+        out[:, :, 1, 4:8] = rd[:, :, 2]
+        out[:, :, 1, 8:12] = rd[:, :, 3]
+        return out
 
     def elevation_azimuth(
         self, rd: Complex64[Tensor, "#batch doppler tx rx range"]
@@ -288,25 +536,24 @@ class AWR2944EVM(RSPTorch):
         """
         mimo = self.mimo_virtual_array(rd)
 
-        if self.window.get("elevation", self._default_window):
-            mimo = self.hann(mimo, 2)
-        if self.window.get("azimuth", self._default_window):
-            mimo = self.hann(mimo, 3)
+        mimo = self._window_elevation_azimuth(mimo)
+        if self.low_precision:
+            mimo = _to_half(mimo)
 
         az_size = self.size.get("azimuth", mimo.shape[3])
         spectrum = self.fft(mimo, axes=(3,), shift=(3,), size=(az_size,))
 
         el_size = self.size.get("elevation", mimo.shape[2])
-        sin_theta = torch.linspace(-1, 1, el_size, device=rd.device)
-        el_elements = torch.arange(
-            mimo.shape[2], dtype=torch.float32, device=rd.device)
-        phases = (-2j * torch.pi * 0.8
-                  * torch.outer(sin_theta, el_elements).to(torch.complex64))
-        steering_matrix = torch.exp(phases)
-
-        el_az_spectrum = torch.einsum(
-            'bdear,ke->bdkar',
-            spectrum, steering_matrix
-        )
-
-        return el_az_spectrum
+        name = f"steering{el_size}x{mimo.shape[2]}"
+        if (name, rd.device) not in self._const_cache:
+            sin_theta = np.linspace(-1, 1, el_size)
+            el_elements = np.arange(mimo.shape[2])
+            phases = -2j * np.pi * 0.8 * np.outer(sin_theta, el_elements)
+            self._const(name, np.exp(phases).astype(np.complex64), rd.device)
+        steering = self._const_cache[(name, rd.device)]
+
+        # With only two elevation lanes the steering contraction is two
+        # broadcast multiply-adds per output bin, fused into one elementwise
+        # kernel instead of an einsum-dispatched degenerate matmul.
+        return (spectrum[:, :, 0:1] * steering[:, 0].view(-1, 1, 1)
+                + spectrum[:, :, 1:2] * steering[:, 1].view(-1, 1, 1))
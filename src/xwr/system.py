@@ -3,7 +3,7 @@
 import logging
 import threading
 from collections.abc import Iterator
-from queue import Empty, Queue
+from queue import SimpleQueue
 from typing import Generic, Literal, TypeVar, cast, overload
 
 import numpy as np
@@ -114,21 +114,25 @@ class XWRSystem(Generic[TRadar]):
         return self.dca.stream(self.config.raw_shape)
 
     @overload
-    def qstream(self, numpy: Literal[True]) -> Queue[np.ndarray | None]: ...
+    def qstream(self, numpy: Literal[True]) -> SimpleQueue[np.ndarray | None]: ...
 
     @overload
     def qstream(
         self, numpy: Literal[False] = False
-    ) -> Queue[types.RadarFrame | None]: ...
+    ) -> SimpleQueue[types.RadarFrame | None]: ...
 
     def qstream(
         self, numpy: bool = False
-    ) -> Queue[types.RadarFrame | None] | Queue[np.ndarray | None]:
+    ) -> SimpleQueue[types.RadarFrame | None] | SimpleQueue[np.ndarray | None]:
         """Read into a queue from a threaded worker.
 
         The threaded worker is run with `daemon=True`. Like [`stream`][..],
         `.qstream()` also relies on another worker to trigger [`stop`][..].
 
+        The queue is a `SimpleQueue`: its C implementation skips the
+        mutex/condvar bookkeeping of `queue.Queue`, which matters at high
+        frame rates with a single producer and consumer.
+
         !!! note
 
             If a `TimeoutError` is received (e.g. after `.stop()`), the
@@ -141,7 +145,8 @@ class XWRSystem(Generic[TRadar]):
             A queue of `RadarFrame` (or np.ndarray) read by the capture card.
                 When the stream terminates, `None` is written to the queue.
         """
-        out: Queue[types.RadarFrame | None] | Queue[np.ndarray | None] = Queue()
+        out: SimpleQueue[types.RadarFrame | None] | SimpleQueue[
+            np.ndarray | None] = SimpleQueue()
 
         def worker():
             try:
@@ -152,7 +157,7 @@ class XWRSystem(Generic[TRadar]):
                                 frame.data, dtype=np.int16
                             ).reshape(*self.config.raw_shape)
                         # Type inference can't figure out this overload check
-                        cast(Queue[np.ndarray | None], out).put(frame)
+                        cast(SimpleQueue[np.ndarray | None], out).put(frame)
                     else:
                         out.put(frame)
             except TimeoutError:
@@ -180,22 +185,45 @@ class XWRSystem(Generic[TRadar]):
             Read frames; the iterator terminates when the capture card stream
                 times out.
         """
-        def drop_frames(q):
-            dropped = 0
-            latest = q.get(block=True)
-
-            while True:
-                try:
-                    latest = q.get_nowait()
+        # Single-slot handoff instead of a queue: the producer overwrites the
+        # stale frame in place (counting it as dropped), so the consumer does
+        # one lock acquisition per frame rather than draining O(backlog)
+        # `get_nowait` calls when it falls behind.
+        cond = threading.Condition()
+        slot: list[types.RadarFrame | np.ndarray | None] = []
+        dropped = 0
+
+        def publish(frame) -> None:
+            nonlocal dropped
+            with cond:
+                if slot:
+                    slot[0] = frame
                     dropped += 1
-                except Empty:
-                    return latest, dropped
+                else:
+                    slot.append(frame)
+                cond.notify()
+
+        def worker():
+            try:
+                for frame in self.stream():
+                    if numpy and frame is not None:
+                        frame = np.frombuffer(
+                            frame.data, dtype=np.int16
+                        ).reshape(*self.config.raw_shape)
+                    publish(frame)
+            except TimeoutError:
+                pass
+            publish(None)
+
+        threading.Thread(target=worker, daemon=True).start()
 
-        q = self.qstream(numpy=numpy)
         while True:
-            frame, dropped = drop_frames(q)
-            if dropped > 0:
-                self.log.warning(f"Dropped {dropped} frames.")
+            with cond:
+                cond.wait_for(lambda: slot)
+                frame = slot.pop()
+                n, dropped = dropped, 0
+            if n > 0:
+                self.log.warning("Dropped %d frames.", n)
             if frame is None:
                 break
             else:
@@ -101,6 +101,62 @@ def test_numpy_basic():
     assert awrl6844(data).shape == (2, 4, 4, 4, 9)
 
 
+@pytest.mark.parametrize("sample_swap", [False, True])
+def test_iq_from_iiqq_backends(sample_swap):
+    """int16 un-interleaving is identical across backends."""
+    data = _iiqq_int16((2, 4, 3, 4, 8 * 2))
+    reference = np.asarray(
+        rsp.iq_from_iiqq(jnp.array(data), sample_swap=sample_swap))
+
+    assert np.array_equal(
+        rsp.iq_from_iiqq(data, sample_swap=sample_swap), reference)
+    assert np.array_equal(
+        rsp.iq_from_iiqq(
+            torch.from_numpy(data), sample_swap=sample_swap).numpy(),
+        reference)
+
+
+def test_numpy_warmup():
+    """Warmup pre-plans the pipeline without changing results."""
+    proc = rspn.AWR1843Boost(window=True, size={"azimuth": 16})
+    proc.warmup(SHAPE["AWR1843Boost"])
+    plans = len(proc._fft_cache)
+    assert plans > 0
+
+    data = _iq_complex(SHAPE["AWR1843Boost"])
+    reference = rspn.AWR1843Boost(window=True, size={"azimuth": 16})(data)
+    assert np.allclose(proc(data), reference, atol=1e-4)
+    assert len(proc._fft_cache) == plans
+
+
+def test_numpy_fft_shift():
+    """Numpy FFT shift matches the reference `np.fft` convention."""
+    awr1843boost = rspn.AWR1843Boost(window=False, size={})
+
+    # Even (4) and odd (3) shift axes, with padding on the even axis.
+    data = _iq_complex((2, 4, 3, 4, 8))
+    result = awr1843boost.fft(data, axes=(1, 2), shift=(1, 2), size=(8, 3))
+    reference = np.fft.fftshift(
+        np.fft.fftn(data, s=(8, 3), axes=(1, 2)), axes=(1, 2))
+    assert np.allclose(result, reference, atol=1e-4)
+
+
+@pytest.mark.parametrize("backend", [rspn, rspj, rspt])
+def test_low_precision(backend):
+    """Half-precision MIMO quantization stays close to full precision."""
+    data = _iq_complex(SHAPE["AWR1843Boost"])
+    if backend is rspj:
+        data = jnp.array(data)
+    elif backend is rspt:
+        data = torch.from_numpy(data)
+
+    full = np.asarray(backend.AWR1843Boost(window=False, size={})(data))
+    half = np.asarray(
+        backend.AWR1843Boost(window=False, size={}, low_precision=True)(data))
+    # bf16/fp16 mantissa: expect ~1e-2 relative error on the peak value.
+    assert np.allclose(full, half, atol=1e-1 * np.abs(full).max())
+
+
 @pytest.mark.parametrize("window,size", AWR2944_PARAMS)
 def test_jax_awr2944(window, size):
     """Test jax vs numpy RSP for AWR2944EVM (I-only data)."""